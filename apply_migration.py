@@ -1,15 +1,16 @@
 import os
-from dotenv import load_dotenv
-from supabase import create_client, Client
+
+from src.config import load_env
+from src.services.database import get_supabase_client
 
 def apply_migrations():
     # Load environment variables
-    load_dotenv()
+    load_env()
     
     # Initialize Supabase client with service role key
     supabase_url = os.getenv("SUPABASE_URL")
     supabase_key = os.getenv("SUPABASE_KEY")  # Use service role key
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase_client(supabase_url, supabase_key)
 
     try:
         # List all triggers and policies
@@ -0,0 +1,95 @@
+import os
+import logging
+import argparse
+from itertools import islice
+from typing import Dict, List
+
+from src.config import load_env
+from src.logging_config import setup_logging
+from src.services.database import DatabaseService
+from src.services.ai_summarizer import AISummarizer
+
+logger = logging.getLogger(__name__)
+
+# Bills considered per submission
+DEFAULT_BACKFILL_LIMIT = 1000
+
+# Bill ids per summary lookup
+SUMMARY_LOOKUP_SIZE = 200
+
+SUMMARY_FIELDS = (
+    "summary",
+    "perspective",
+    "key_points",
+    "estimated_cost_impact",
+    "government_growth_analysis",
+    "market_impact_analysis",
+    "liberty_impact_analysis",
+)
+
+def bill_content(bill: Dict) -> str:
+    """Describe a stored bill for summarization."""
+    return f"""Title: {bill.get('title') or 'N/A'}
+Description: {bill.get('description') or 'N/A'}
+Latest Action: {bill.get('latest_action_text') or 'N/A'}"""
+
+def submit(db_service: DatabaseService, summarizer: AISummarizer, limit: int) -> None:
+    """Submit a batch job summarizing stored bills that have no AI summary yet."""
+    contents = {}
+
+    def add_unsummarized(bills: List[Dict]) -> None:
+        summarized = db_service.get_summarized_target_ids([bill["id"] for bill in bills], "bill")
+        contents.update((f"bill:{bill['id']}", bill_content(bill)) for bill in bills if bill["id"] not in summarized)
+
+    # Bills are paged in from the database and checked for summaries in
+    # chunks, keeping each id filter within URL length limits
+    pending = []
+    for bill in islice(db_service.iter_bills_for_processing(), limit):
+        pending.append(bill)
+        if len(pending) == SUMMARY_LOOKUP_SIZE:
+            add_unsummarized(pending)
+            pending = []
+    if pending:
+        add_unsummarized(pending)
+
+    if not contents:
+        logger.info("No bills need a backfilled summary")
+        return
+    batch_id = summarizer.submit_batch(contents)
+    db_service.create_batch_job(batch_id, len(contents))
+
+def collect(db_service: DatabaseService, summarizer: AISummarizer) -> None:
+    """Store the summaries of finished batch jobs and refresh the status of open ones."""
+    for job in db_service.get_open_batch_jobs():
+        batch_id = job["batch_id"]
+        status, results = summarizer.poll_batch(batch_id)
+        if results:
+            rows = []
+            for custom_id, summary in results.items():
+                target_type, target_id = custom_id.split(":", 1)
+                row = {"target_id": target_id, "target_type": target_type}
+                row.update((field, summary.get(field)) for field in SUMMARY_FIELDS)
+                rows.append(row)
+            db_service.bulk_upsert_ai_summaries(rows)
+        logger.info("Batch %s is %s", batch_id, status)
+        db_service.update_batch_job_status(batch_id, status)
+
+def main() -> None:
+    """Run the summary backfill from the command line."""
+    parser = argparse.ArgumentParser(description="Backfill AI summaries through the OpenAI Batch API.")
+    parser.add_argument("command", choices=["submit", "collect"])
+    parser.add_argument("--limit", type=int, default=DEFAULT_BACKFILL_LIMIT)
+    args = parser.parse_args()
+
+    load_env()
+    setup_logging()
+
+    db_service = DatabaseService(url=os.getenv("SUPABASE_URL"), key=os.getenv("SUPABASE_KEY"))
+    summarizer = AISummarizer()
+    if args.command == "submit":
+        submit(db_service, summarizer, args.limit)
+    else:
+        collect(db_service, summarizer)
+
+if __name__ == "__main__":
+    main()
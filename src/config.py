@@ -1,4 +1,15 @@
 import os
+from functools import lru_cache
+from typing import Dict
+from dotenv import dotenv_values
+
+@lru_cache(maxsize=1)
+def load_env() -> Dict[str, str]:
+    """Parse .env once per process and add its values to os.environ without overriding ones already set."""
+    values = {key: value for key, value in dotenv_values().items() if value is not None}
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+    return values
 
 class Settings:
     """Application settings and environment variables."""
@@ -28,7 +39,7 @@ class Settings:
     CONGRESS_UPDATE_INTERVAL: int = 24  # hours
     
     # OpenAI Settings
-    OPENAI_MODEL: str = "gpt-4-1106-preview"
+    OPENAI_MODEL: str = "gpt-4o-mini"
     OPENAI_MAX_TOKENS: int = 1000
     OPENAI_TEMPERATURE: float = 0.7
     
@@ -0,0 +1,62 @@
+import logging
+from typing import Dict, List, Sequence
+
+from psycopg2 import sql
+from psycopg2.extras import Json, RealDictCursor, execute_values
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement
+PAGE_SIZE = 500
+
+# Unique constraint each table's upserts resolve conflicts on
+CONFLICT_TARGETS = {
+    "bills": ("congress_number", "bill_type", "bill_number"),
+    "amendments": ("congress_number", "amendment_type", "amendment_number"),
+    "ai_summaries": ("target_id", "target_type"),
+    "processing_status": ("target_id", "target_type"),
+}
+
+def _adapt(value):
+    """Wrap dicts and lists so psycopg2 sends them as JSONB."""
+    if isinstance(value, (dict, list)):
+        return Json(value)
+    return value
+
+def bulk_upsert(conn, table: str, rows: Sequence[Dict], page_size: int = PAGE_SIZE,
+                returning: bool = True) -> List[Dict]:
+    """Upsert rows with one INSERT ... ON CONFLICT DO UPDATE statement per page and return the stored rows.
+
+    With returning=False the statement has no RETURNING clause and an empty list is returned.
+    """
+    if not rows:
+        return []
+
+    conflict_columns = CONFLICT_TARGETS[table]
+    columns = list(rows[0])
+    query = sql.SQL(
+        "INSERT INTO {table} ({columns}) VALUES %s "
+        "ON CONFLICT ({conflict}) DO UPDATE SET {updates}{returning}"
+    ).format(
+        table=sql.Identifier(table),
+        columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+        conflict=sql.SQL(", ").join(map(sql.Identifier, conflict_columns)),
+        updates=sql.SQL(", ").join(
+            sql.SQL("{column} = EXCLUDED.{column}").format(column=sql.Identifier(column))
+            for column in columns
+            if column not in conflict_columns
+        ),
+        returning=sql.SQL(" RETURNING *" if returning else ""),
+    )
+    values = [tuple(_adapt(row.get(column)) for column in columns) for row in rows]
+
+    try:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            stored = execute_values(cur, query.as_string(cur), values, page_size=page_size, fetch=returning) or []
+        conn.commit()
+        logger.info("Successfully upserted %d rows into %s", len(rows), table)
+        return stored
+    except Exception as e:
+        conn.rollback()
+        logger.error("Error bulk upserting into %s: %s", table, e)
+        raise
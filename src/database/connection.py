@@ -1,31 +1,83 @@
 import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
 import psycopg2
-from urllib.parse import urlparse
+from psycopg2.pool import ThreadedConnectionPool
+from urllib.parse import parse_qs, urlparse
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Connections are per process, so the database sees up to
+# workers * DB_MAX_CONNECTIONS of them; keep that under max_connections
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_CONNECT_TIMEOUT = 30  # seconds
+
+# libpq options carried over from a connection URL's query string
+URL_CONNECTION_OPTIONS = ("sslmode",)
+
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def pooled_database_url() -> Optional[str]:
+    """URL for pooled connections: Supabase's transaction-mode pooler when configured, else DATABASE_URL."""
+    return os.getenv("SUPABASE_POOLER_URL") or os.getenv("DATABASE_URL")
+
+def _connection_params(url: str) -> Dict:
+    """Build psycopg2 connection arguments from a postgres:// URL."""
+    # Parse the URL into components
+    db_url = urlparse(url)
+    options = parse_qs(db_url.query)
+
+    # Log the connection parameters
+    logger.debug("Connecting with dbname=%s, user=%s, host=%s, port=%s", db_url.path[1:], db_url.username, db_url.hostname, db_url.port)
+
+    return {
+        "dbname": db_url.path[1:],  # Remove leading slash
+        "user": db_url.username,
+        "password": db_url.password,
+        "host": db_url.hostname,
+        "port": db_url.port,
+        "connect_timeout": int(os.getenv("DB_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+        **{option: options[option][-1] for option in URL_CONNECTION_OPTIONS if option in options},
+    }
+
 def get_db_connection():
-    """Create a database connection with the correct number of arguments"""
+    """Create a direct database connection, for work like DDL that needs session state the pooler doesn't keep"""
     try:
-        # Parse DATABASE_URL into components
-        db_url = urlparse(os.getenv('DATABASE_URL'))
-        
-        # Log the parsed components for debugging
-        logger.debug(f"Parsed DB URL: {db_url}")
-
-        # Log the connection parameters
-        logger.debug(f"Connecting with dbname={db_url.path[1:]}, user={db_url.username}, host={db_url.hostname}, port={db_url.port}")
-
-        # Create connection with only the necessary arguments
-        conn = psycopg2.connect(
-            dbname=db_url.path[1:],  # Remove leading slash
-            user=db_url.username,
-            password=db_url.password,
-            host=db_url.hostname,
-            port=db_url.port
-        )
-        return conn
+        return psycopg2.connect(**_connection_params(os.getenv("DATABASE_URL")))
     except Exception as e:
-        logger.error(f"Database connection error: {str(e)}")
-        raise 
\ No newline at end of file
+        logger.error("Database connection error: %s", e)
+        raise
+
+def get_db_pool() -> ThreadedConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                max_connections = int(os.getenv("DB_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS))
+                try:
+                    # Through the pooler, each of these is a cheap client slot that
+                    # borrows a Postgres backend only for the length of a transaction
+                    _pool = ThreadedConnectionPool(1, max_connections, **_connection_params(pooled_database_url()))
+                except Exception as e:
+                    logger.error("Database connection error: %s", e)
+                    raise
+                logger.info("Created database connection pool with up to %d connections", max_connections)
+    return _pool
+
+@contextmanager
+def pooled_connection() -> Iterator:
+    """Borrow a connection from the pool for the duration of the block."""
+    pool = get_db_pool()
+    conn = pool.getconn()
+    if conn.closed:
+        # Replace connections the server dropped while they sat idle
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn, close=bool(conn.closed))
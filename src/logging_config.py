@@ -0,0 +1,19 @@
+import logging
+from typing import Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Second resolution, so timestamps skip the millisecond formatting step
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# File the web app logs to alongside the console
+APP_LOG_FILE = 'app.log'
+
+def setup_logging(log_file: Optional[str] = None, level: int = logging.INFO) -> None:
+    """Configure root logging once per process; calls after the first leave the existing handlers alone."""
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    logging.basicConfig(level=level, format=LOG_FORMAT, datefmt=DATE_FORMAT, handlers=handlers)
@@ -1,36 +1,56 @@
 import os
 import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List
-from dotenv import load_dotenv
-import traceback
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
 import time
 from functools import wraps
 
-from fastapi import FastAPI, HTTPException
+import uvloop
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from src.config import load_env
+from src.logging_config import APP_LOG_FILE, setup_logging
 from src.services.congress_client import CongressClient
-from src.services.database import DatabaseService
+from src.models import Amendment, Bill
+from src.services.database import (
+    AISummaryRow,
+    AmendmentRow,
+    BillRow,
+    DatabaseService,
+    ProcessingStatusRow,
+    amendment_uuid,
+    bill_uuid,
+)
 from src.services.ai_service import AIService
 
 # Load environment variables
-load_dotenv()
+load_env()
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
-)
+setup_logging(log_file=APP_LOG_FILE)
 logger = logging.getLogger(__name__)
 
+# Use the libuv-based event loop for every loop created in this process
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start services when the server starts serving and stop them when it shuts down."""
+    await start_services()
+    try:
+        yield
+    finally:
+        await stop_services()
+
 # Initialize FastAPI app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -47,18 +67,65 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_KEY")
-congress_api_key = os.getenv("CONGRESS_API_KEY")
-openai_api_key = os.getenv("OPENAI_API_KEY")
+# Services are created in start_services so importing the app stays cheap;
+# the AI service is only built once a summary is first requested
+db_service: Optional[DatabaseService] = None
+congress_client: Optional[CongressClient] = None
+ai_service: Optional[AIService] = None
+
+def get_ai_service() -> AIService:
+    """Return the shared AI service, creating it on first use."""
+    global ai_service
+    if ai_service is None:
+        ai_service = AIService(api_key=os.getenv("OPENAI_API_KEY"), cache_store=db_service)
+    return ai_service
+
+# Fields of the Congress.gov payloads that the pipeline actually reads. Detail
+# responses also carry sponsors, cosponsors, text versions, committees, etc.,
+# which we never store or send to the AI service.
+BILL_FIELDS = frozenset({
+    "title",
+    "summary",
+    "latestAction",
+    "actions",
+    "amendments",
+})
+AMENDMENT_FIELDS = frozenset({
+    "congress",
+    "type",
+    "number",
+    "description",
+    "purpose",
+    "submittedDate",
+    "latestAction",
+    "chamber",
+    "url",
+})
+
+# Number of bills processed concurrently in each cycle
+MAX_CONCURRENT_BILLS = 8
+
+# Largest page the listing endpoints will return
+MAX_RESULTS_LIMIT = 100
+
+# Congress whose bills are tracked
+CURRENT_CONGRESS = 118
 
-if not all([supabase_url, supabase_key, congress_api_key, openai_api_key]):
-    raise ValueError("Missing required environment variables")
+# How often bills are processed, and how soon a failed cycle is retried
+PROCESSING_INTERVAL_HOURS = 1
+PROCESSING_RETRY_DELAY = timedelta(minutes=5)
+PROCESSING_JOB_ID = "process_bills"
 
-db_service = DatabaseService(url=supabase_url, key=supabase_key)
-congress_client = CongressClient(api_key=congress_api_key)
-ai_service = AIService(api_key=openai_api_key)
+# sync_state entry holding the latest bill update a cycle has fully fetched;
+# without one the first cycle falls back to the most recent bills
+BILL_SYNC_NAME = "bills"
+INITIAL_BILL_LIMIT = 50
+
+scheduler = AsyncIOScheduler(timezone=timezone.utc)
+
+def project_fields(data: Dict, fields: frozenset) -> Dict:
+    """Return a copy of a Congress.gov payload restricted to the given fields."""
+    return {key: data[key] for key in fields if key in data}
 
 def ensure_utc_datetime(date_str: str) -> datetime:
     """Convert a date string to a UTC timezone-aware datetime object."""
@@ -85,6 +152,11 @@ def ensure_utc_datetime(date_str: str) -> datetime:
     
     return dt
 
+def bill_update_time(bill: Bill) -> datetime:
+    """Return when a Congress.gov bill list entry was last updated."""
+    # updateDate is a bare date; the text variant carries the time as well
+    return ensure_utc_datetime(bill.get("updateDateIncludingText") or bill.get("updateDate"))
+
 def with_database_retry(max_retries=3, delay=5):
     """Decorator to retry database operations with exponential backoff."""
     def decorator(func):
@@ -99,171 +171,370 @@ def with_database_retry(max_retries=3, delay=5):
                 except Exception as e:
                     retries += 1
                     if retries == max_retries:
-                        logger.error(f"Final database operation failure after {retries} retries: {str(e)}\n{traceback.format_exc()}")
+                        logger.exception("Final database operation failure after %d retries: %s", retries, e)
                         raise
                     wait_time = delay * (2 ** (retries - 1))  # Exponential backoff
-                    logger.warning(f"Database operation failed, attempt {retries} of {max_retries}. Retrying in {wait_time} seconds...")
+                    logger.warning("Database operation failed, attempt %d of %d. Retrying in %d seconds...", retries, max_retries, wait_time)
                     await asyncio.sleep(wait_time)
             return None
         return wrapper
     return decorator
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services and start background tasks."""
+async def start_services(run_scheduler: Optional[bool] = None):
+    """Initialize services and, in the one process that runs it, start the bill processing scheduler.
+    
+    run_scheduler defaults to the RUN_SCHEDULER environment variable; web workers leave it unset so
+    that several of them never process bills concurrently.
+    """
+    global db_service, congress_client
+    if run_scheduler is None:
+        run_scheduler = os.getenv("RUN_SCHEDULER") == "1"
     logger.info("Application startup event triggered.")
-    asyncio.create_task(process_bills())
+    
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_KEY")
+    congress_api_key = os.getenv("CONGRESS_API_KEY")
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    
+    if not all([supabase_url, supabase_key, congress_api_key, openai_api_key]):
+        raise ValueError("Missing required environment variables")
+    
+    db_service = DatabaseService(url=supabase_url, key=supabase_key)
+    if not run_scheduler:
+        return
+    # Only the pipeline calls Congress.gov, so its quota is paced in this process alone
+    congress_client = CongressClient(api_key=congress_api_key)
+    
+    # Started here so the scheduler binds to the server's running event loop
+    scheduler.add_job(
+        process_bills,
+        IntervalTrigger(hours=PROCESSING_INTERVAL_HOURS),
+        id=PROCESSING_JOB_ID,
+        next_run_time=datetime.now(timezone.utc),
+        max_instances=1,
+        coalesce=True
+    )
+    scheduler.start()
+
+async def stop_services():
+    """Stop scheduled background jobs, drain queued AI summaries and close API connections."""
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+    if ai_service is not None:
+        await ai_service.aclose()
+    if congress_client is not None:
+        await congress_client.aclose()
+
+@dataclass(slots=True)
+class ProcessingBatch:
+    """Rows produced during one processing cycle, written with bulk upserts at the end."""
+    processed_at: datetime
+    summaries: List[AISummaryRow] = field(default_factory=list)
+    statuses: List[ProcessingStatusRow] = field(default_factory=list)
+
+    def add_summary(self, target_id: str, target_type: str, summary: Dict, source_hash: str = None) -> None:
+        self.summaries.append({
+            "target_id": target_id,
+            "target_type": target_type,
+            "source_text_sha256": source_hash,
+            "summary": summary["summary"],
+            "perspective": summary["perspective"],
+            "key_points": summary["key_points"],
+            "estimated_cost_impact": summary["estimated_cost_impact"],
+            "government_growth_analysis": summary["government_growth_analysis"],
+            "market_impact_analysis": summary["market_impact_analysis"],
+            "liberty_impact_analysis": summary["liberty_impact_analysis"]
+        })
+
+    def add_status(self, target_id: str, target_type: str, status: str,
+                   error_message: str = None, source_update_date: str = None) -> None:
+        self.statuses.append({
+            "target_id": target_id,
+            "target_type": target_type,
+            "status": status,
+            "error_message": error_message,
+            "source_update_date": source_update_date,
+            "last_processed": self.processed_at
+        })
+
+def build_bill_row(bill: Bill, bill_details: Bill) -> BillRow:
+    """Map a Congress.gov bill list entry and its details onto a bills table row."""
+    bill_number = int(bill["number"])
+    return {
+        "id": bill_uuid(bill["congress"], bill["type"], bill_number),
+        "congress_number": bill["congress"],
+        "bill_type": bill["type"],
+        "bill_number": bill_number,
+        "title": bill.get("title"),
+        "description": bill_details.get("summary", ""),
+        "origin_chamber": bill.get("originChamber"),
+        "origin_chamber_code": bill.get("originChamberCode"),
+        "introduced_date": bill.get("introducedDate"),
+        "latest_action_date": bill.get("latestAction", {}).get("actionDate"),
+        "latest_action_text": bill.get("latestAction", {}).get("text"),
+        "update_date": bill.get("updateDate"),
+        "url": bill.get("url"),
+        "actions": bill_details.get("actions", [])
+    }
+
+def build_amendment_row(amendment: Amendment, bill_id: str) -> AmendmentRow:
+    """Map a Congress.gov amendment onto an amendments table row."""
+    amendment_number = int(amendment.get("number"))
+    return {
+        "id": amendment_uuid(amendment.get("congress"), amendment.get("type"), amendment_number),
+        "bill_id": bill_id,
+        "congress_number": amendment.get("congress"),
+        "amendment_type": amendment.get("type"),
+        "amendment_number": amendment_number,
+        "description": amendment.get("description", ""),
+        "purpose": amendment.get("purpose", ""),
+        "submitted_date": amendment.get("submittedDate"),
+        "latest_action_date": amendment.get("latestAction", {}).get("actionDate"),
+        "latest_action_text": amendment.get("latestAction", {}).get("text"),
+        "chamber": amendment.get("chamber"),
+        "url": amendment.get("url")
+    }
+
+async def list_changed_bills() -> List[Bill]:
+    """List bills updated since the last synced update, or the most recent bills on the first run."""
+    try:
+        watermark = await asyncio.to_thread(db_service.get_sync_watermark, BILL_SYNC_NAME)
+    except Exception as e:
+        logger.error("Error looking up the bill sync watermark: %s", e)
+        watermark = None
+    if watermark:
+        updates = congress_client.iter_updates_since(ensure_utc_datetime(watermark), congress=CURRENT_CONGRESS)
+        return [bill async for bill in updates]
+    return [bill async for bill in congress_client.iter_recent_bills(congress=CURRENT_CONGRESS, limit=INITIAL_BILL_LIMIT)]
+
+async def select_changed_bills() -> Tuple[List[Bill], List[Bill]]:
+    """List bills to sync and return (all listed bills, bills that changed since they were last summarized)."""
+    bills = await list_changed_bills()
+    
+    # Bills whose updateDate hasn't moved since they were last summarized
+    # need neither a details fetch nor a new summary
+    try:
+        processed = await asyncio.to_thread(
+            db_service.get_processed_update_dates,
+            CURRENT_CONGRESS,
+            [int(bill["number"]) for bill in bills]
+        )
+    except Exception as e:
+        logger.error("Error looking up previously processed bills: %s", e)
+        processed = {}
+    
+    changed = [
+        bill for bill in bills
+        if not bill.get("updateDate")
+        or processed.get((bill["congress"], bill["type"], int(bill["number"]))) != bill["updateDate"]
+    ]
+    logger.info("Skipped %d unchanged bills, processing %d", len(bills) - len(changed), len(changed))
+    return bills, changed
+
+async def fetch_amendments(bill: Bill, bill_details: Bill) -> List[Tuple[Amendment, AmendmentRow]]:
+    """Fetch a bill's amendments as (amendment, amendments row) pairs."""
+    try:
+        bill_amendments = await congress_client.get_bill_amendments(
+            congress=bill["congress"],
+            bill_type=bill["type"],
+            bill_number=bill["number"],
+            bill_data=bill_details
+        )
+    except Exception as e:
+        logger.error("Error fetching amendments for bill %s%s: %s", bill.get("type"), bill.get("number"), e)
+        return []
+    
+    bill_id = bill_uuid(bill["congress"], bill["type"], int(bill["number"]))
+    amendments = []
+    for amendment in bill_amendments:
+        try:
+            amendment = project_fields(amendment, AMENDMENT_FIELDS)
+            amendments.append((amendment, build_amendment_row(amendment, bill_id)))
+        except Exception as e:
+            logger.error("Error processing amendment: %s", e)
+    return amendments
+
+async def process_bill_graph(bill: Bill, batch: ProcessingBatch,
+                             summary_hashes: Dict) -> Tuple[Bill, Optional[BillRow], List[AmendmentRow]]:
+    """Fetch a bill's details, then summarize it while its amendments are fetched and summarized.
+    
+    Returns the bill with its bills row and amendments rows; the row is None if the details fetch failed.
+    """
+    try:
+        response = await congress_client.get_bill_details(
+            congress=bill["congress"],
+            bill_type=bill["type"],
+            bill_number=bill["number"]
+        )
+    except Exception as e:
+        logger.exception("Error fetching details for bill %s%s: %s", bill["type"], bill["number"], e)
+        return bill, None, []
+    bill_details = project_fields(response.get("bill", response), BILL_FIELDS)
+    row = build_bill_row(bill, bill_details)
+    
+    # Ids are derived from natural keys, so summaries can be generated before
+    # any row is stored; everything is written together once the cycle ends
+    summary_task = asyncio.create_task(
+        process_bill(bill, bill_details, row["id"], batch, summary_hashes.get(row["id"]))
+    )
+    amendments = await fetch_amendments(bill, bill_details)
+    await asyncio.gather(
+        summary_task,
+        *(process_amendment(amendment, amendment_row["id"], batch) for amendment, amendment_row in amendments)
+    )
+    return bill, row, [amendment_row for _, amendment_row in amendments]
+
+async def process_amendment(amendment: Amendment, amendment_id: str, batch: ProcessingBatch) -> None:
+    """Generate an amendment's AI summary and add it to the batch."""
+    try:
+        amendment_summary = await get_ai_service().generate_amendment_summary(amendment)
+        if amendment_summary:
+            batch.add_summary(amendment_id, "amendment", amendment_summary)
+    except Exception as e:
+        logger.error("Error processing amendment summary: %s", e)
+
+async def process_bill(bill: Bill, bill_details: Bill, bill_id: str, batch: ProcessingBatch,
+                       stored_hash: Optional[str] = None) -> None:
+    """Generate a bill's AI summary and add it and its processing status to the batch."""
+    bill_type = bill.get("type")
+    bill_number = bill.get("number")
+    update_date = bill.get("updateDate")
+    
+    service = get_ai_service()
+    source_hash = service.bill_source_hash(bill_details)
+    if source_hash == stored_hash:
+        # The stored summary was generated from identical input
+        logger.debug("Reusing summary for unchanged bill %s%s", bill_type, bill_number)
+        batch.add_status(bill_id, "bill", "completed", source_update_date=update_date)
+        return
+    
+    try:
+        summary = await service.generate_bill_summary(bill_details)
+    except Exception as e:
+        logger.exception("Error generating summary for bill %s%s: %s", bill_type, bill_number, e)
+        batch.add_status(bill_id, "bill", "error", error_message=str(e))
+        return
+    
+    try:
+        batch.add_summary(bill_id, "bill", summary, source_hash=source_hash)
+        batch.add_status(bill_id, "bill", "completed", source_update_date=update_date)
+        logger.debug("Successfully processed bill %s%s", bill_type, bill_number)
+    except Exception as e:
+        logger.exception("Invalid summary for bill %s%s: %s", bill_type, bill_number, e)
+        batch.add_status(bill_id, "bill", "error", error_message=str(e))
+
+async def flush_batch(batch: ProcessingBatch) -> bool:
+    """Write a cycle's summaries and then its processing statuses in bulk, returning whether both were stored."""
+    try:
+        await asyncio.to_thread(db_service.bulk_upsert_ai_summaries, batch.summaries, returning=False)
+    except Exception as e:
+        # Leave statuses unwritten so the bills are not recorded as completed
+        logger.exception("Error storing AI summaries: %s", e)
+        return False
+    try:
+        await asyncio.to_thread(db_service.bulk_update_processing_status, batch.statuses, returning=False)
+    except Exception as e:
+        logger.exception("Error recording processing status: %s", e)
+        return False
+    return True
+
+def schedule_retry() -> None:
+    """Bring the next processing cycle forward after a failed one."""
+    scheduler.modify_job(PROCESSING_JOB_ID, next_run_time=datetime.now(timezone.utc) + PROCESSING_RETRY_DELAY)
 
 async def process_bills():
-    """Background task to fetch and process bills."""
-    while True:
+    """Scheduled job to fetch and process recent bills."""
+    # One timestamp per cycle, shared by every status record written in it
+    batch = ProcessingBatch(processed_at=datetime.now(timezone.utc))
+    
+    try:
+        bills, changed = await select_changed_bills()
+    except Exception as e:
+        logger.exception("Failed to fetch recent bills: %s", e)
+        schedule_retry()
+        return
+    
+    bill_ids = [bill_uuid(bill["congress"], bill["type"], int(bill["number"])) for bill in changed]
+    try:
+        summary_hashes = await asyncio.to_thread(db_service.get_summary_source_hashes, bill_ids, "bill")
+    except Exception as e:
+        logger.error("Error looking up stored summary hashes: %s", e)
+        summary_hashes = {}
+    
+    # Each bill runs as its own task graph, bounded so we stay within API
+    # rate limits, and is collected as soon as it finishes
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BILLS)
+    
+    async def run(bill: Bill) -> Tuple[Bill, Optional[BillRow], List[AmendmentRow]]:
+        async with semaphore:
+            return await process_bill_graph(bill, batch, summary_hashes)
+    
+    bill_rows = []
+    amendment_rows = []
+    failed = []
+    for next_bill in asyncio.as_completed([run(bill) for bill in changed]):
+        bill, row, amendments = await next_bill
+        if row is None:
+            failed.append(bill)
+            continue
+        bill_rows.append(row)
+        amendment_rows.extend(amendments)
+    
+    # Bills whose summary failed are recorded as errors and must be listed again too
+    errored = {
+        status["target_id"] for status in batch.statuses
+        if status["target_type"] == "bill" and status["status"] == "error"
+    }
+    failed.extend(bill for bill, bill_id in zip(changed, bill_ids) if bill_id in errored)
+    
+    # Store every fetched bill in a single upsert
+    try:
+        await asyncio.to_thread(db_service.bulk_upsert_bills, bill_rows, returning=False)
+    except Exception as e:
+        logger.exception("Error storing bills: %s", e)
+        schedule_retry()
+        return
+    amendments_stored = True
+    try:
+        await asyncio.to_thread(db_service.bulk_upsert_amendments, amendment_rows, returning=False)
+    except Exception as e:
+        logger.exception("Error storing amendments: %s", e)
+        amendments_stored = False
+        # Summaries of unstored amendments would fail target validation
+        batch.summaries = [summary for summary in batch.summaries if summary["target_type"] != "amendment"]
+    
+    if not await flush_batch(batch) or not amendments_stored:
+        # Keep the previous watermark so every bill of this cycle is listed again
+        logger.warning("Not advancing the bill sync watermark after failed writes")
+        schedule_retry()
+        return
+    
+    # Resume from the earliest failure so it is listed again next cycle
+    if failed:
+        watermark = min(bill_update_time(bill) for bill in failed)
+    else:
+        watermark = max((bill_update_time(bill) for bill in bills), default=None)
+    if watermark:
         try:
-            # Get recent bills from Congress.gov
-            try:
-                bills_data = congress_client.get_recent_bills(congress=118, limit=50)
-                bills = bills_data.get("bills", [])
-            except Exception as e:
-                logger.error(f"Failed to fetch recent bills: {str(e)}\n{traceback.format_exc()}")
-                await asyncio.sleep(300)  # Wait 5 minutes before retrying
-                continue
-            
-            for bill in bills:
-                try:
-                    # Get detailed bill information
-                    try:
-                        bill_details = congress_client.get_bill_details(
-                            congress=bill["congress"],
-                            bill_type=bill["type"],
-                            bill_number=bill["number"]
-                        )
-                    except Exception as e:
-                        logger.error(f"Error fetching details for bill {bill.get('type')}{bill.get('number')}: {str(e)}\n{traceback.format_exc()}")
-                        continue
-                    
-                    # Store bill in database
-                    try:
-                        bill_data = {
-                            "congress_number": bill["congress"],
-                            "bill_type": bill["type"],
-                            "bill_number": int(bill["number"]),
-                            "title": bill.get("title"),
-                            "description": bill_details.get("summary", ""),
-                            "origin_chamber": bill.get("originChamber"),
-                            "origin_chamber_code": bill.get("originChamberCode"),
-                            "introduced_date": bill.get("introducedDate"),
-                            "latest_action_date": bill.get("latestAction", {}).get("actionDate"),
-                            "latest_action_text": bill.get("latestAction", {}).get("text"),
-                            "update_date": bill.get("updateDate"),
-                            "url": bill.get("url"),
-                            "actions": bill_details.get("actions", [])
-                        }
-                        
-                        stored_bill = db_service.upsert_bill(bill_data)
-                        if not stored_bill:
-                            logger.error(f"Failed to store bill {bill['type']}{bill['number']}")
-                            continue
-                            
-                        # Process amendments if they exist
-                        if bill_details.get("amendments"):
-                            for amendment in bill_details["amendments"]:
-                                try:
-                                    amendment_data = {
-                                        "bill_id": stored_bill["id"],
-                                        "congress_number": amendment.get("congress"),
-                                        "amendment_type": amendment.get("type"),
-                                        "amendment_number": int(amendment.get("number")),
-                                        "description": amendment.get("description", ""),
-                                        "purpose": amendment.get("purpose", ""),
-                                        "submitted_date": amendment.get("submittedDate"),
-                                        "latest_action_date": amendment.get("latestAction", {}).get("actionDate"),
-                                        "latest_action_text": amendment.get("latestAction", {}).get("text"),
-                                        "chamber": amendment.get("chamber"),
-                                        "url": amendment.get("url")
-                                    }
-                                    
-                                    stored_amendment = db_service.upsert_amendment(amendment_data)
-                                    if stored_amendment:
-                                        # Generate and store amendment summary
-                                        try:
-                                            amendment_summary = await ai_service.generate_amendment_summary(amendment)
-                                            if amendment_summary:
-                                                summary_data = {
-                                                    "target_id": stored_amendment["id"],
-                                                    "target_type": "amendment",
-                                                    "summary": amendment_summary["summary"],
-                                                    "perspective": amendment_summary["perspective"],
-                                                    "key_points": amendment_summary["key_points"],
-                                                    "estimated_cost_impact": amendment_summary["estimated_cost_impact"],
-                                                    "government_growth_analysis": amendment_summary["government_growth_analysis"],
-                                                    "market_impact_analysis": amendment_summary["market_impact_analysis"],
-                                                    "liberty_impact_analysis": amendment_summary["liberty_impact_analysis"]
-                                                }
-                                                db_service.upsert_ai_summary(summary_data)
-                                        except Exception as e:
-                                            logger.error(f"Error processing amendment summary: {str(e)}")
-                                except Exception as e:
-                                    logger.error(f"Error processing amendment: {str(e)}")
-                                    continue
-                                
-                    except Exception as e:
-                        logger.error(f"Error storing bill {bill.get('type')}{bill.get('number')}: {str(e)}\n{traceback.format_exc()}")
-                        continue
-                    
-                    # Generate AI summary for bill
-                    try:
-                        summary = await ai_service.generate_bill_summary(bill_details)
-                    except Exception as e:
-                        logger.error(f"Error generating summary for bill {bill.get('type')}{bill.get('number')}: {str(e)}\n{traceback.format_exc()}")
-                        continue
-                    
-                    # Store AI summary for bill
-                    try:
-                        summary_data = {
-                            "target_id": stored_bill["id"],
-                            "target_type": "bill",
-                            "summary": summary["summary"],
-                            "perspective": summary["perspective"],
-                            "key_points": summary["key_points"],
-                            "estimated_cost_impact": summary["estimated_cost_impact"],
-                            "government_growth_analysis": summary["government_growth_analysis"],
-                            "market_impact_analysis": summary["market_impact_analysis"],
-                            "liberty_impact_analysis": summary["liberty_impact_analysis"]
-                        }
-                        
-                        db_service.upsert_ai_summary(summary_data)
-                        logger.info(f"Successfully processed bill {bill['type']}{bill['number']}")
-                    except Exception as e:
-                        logger.error(f"Error storing summary for bill {bill.get('type')}{bill.get('number')}: {str(e)}\n{traceback.format_exc()}")
-                        continue
-                    
-                except Exception as e:
-                    logger.error(f"Unexpected error processing bill {bill.get('type')}{bill.get('number')}: {str(e)}\n{traceback.format_exc()}")
-                    continue
-                
-                # Sleep briefly between bills to avoid rate limiting
-                await asyncio.sleep(1)
-            
+            await asyncio.to_thread(db_service.set_sync_watermark, BILL_SYNC_NAME, watermark.isoformat())
         except Exception as e:
-            logger.error(f"Critical error in bill processing loop: {str(e)}\n{traceback.format_exc()}")
-            await asyncio.sleep(300)  # Wait 5 minutes before retrying
-        
-        # Sleep for an hour before checking for new bills
-        logger.info("Completed processing cycle, sleeping for 1 hour")
-        await asyncio.sleep(3600)
+            logger.error("Error saving the bill sync watermark: %s", e)
+    
+    logger.info("Completed processing cycle")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     try:
         # Test database connection
-        db_service.get_recent_summaries(limit=1)
+        await asyncio.to_thread(db_service.get_recent_summaries, limit=1)
         return {
             "status": "healthy",
             "database": "connected",
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        logger.error("Health check failed: %s", e)
         return {
             "status": "unhealthy",
             "database": "disconnected",
@@ -273,13 +544,13 @@ async def health_check():
 
 @app.get("/api/v1/bills/recent")
 @with_database_retry(max_retries=3, delay=5)
-async def get_recent_bills(limit: int = 10):
+async def get_recent_bills(limit: int = Query(10, ge=1, le=MAX_RESULTS_LIMIT)):
     """Get recent bills with their AI summaries."""
     try:
-        bills = db_service.get_recent_summaries(limit=limit)
+        bills = await asyncio.to_thread(db_service.get_recent_summaries, limit=limit)
         return {"bills": bills}
     except Exception as e:
-        logger.error(f"Error getting recent bills: {str(e)}")
+        logger.error("Error getting recent bills: %s", e)
         raise HTTPException(
             status_code=503,
             detail={
@@ -293,14 +564,14 @@ async def get_recent_bills(limit: int = 10):
 async def get_bill_details(congress: int, bill_type: str, bill_number: int):
     """Get details for a specific bill."""
     try:
-        bill = db_service.get_bill_with_summaries(congress=congress, bill_type=bill_type, bill_number=bill_number)
+        bill = await asyncio.to_thread(db_service.get_bill_with_summaries, congress=congress, bill_type=bill_type, bill_number=bill_number)
         if not bill:
             raise HTTPException(status_code=404, detail="Bill not found")
         return bill
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting bill details: {str(e)}")
+        logger.error("Error getting bill details: %s", e)
         raise HTTPException(
             status_code=503,
             detail={
@@ -311,13 +582,13 @@ async def get_bill_details(congress: int, bill_type: str, bill_number: int):
 
 @app.get("/api/v1/summaries/recent")
 @with_database_retry(max_retries=3, delay=5)
-async def get_recent_summaries(limit: int = 10):
+async def get_recent_summaries(limit: int = Query(10, ge=1, le=MAX_RESULTS_LIMIT)):
     """Get recent AI summaries."""
     try:
-        summaries = db_service.get_recent_summaries(limit=limit)
+        summaries = await asyncio.to_thread(db_service.get_recent_summaries, limit=limit)
         return {"summaries": summaries}
     except Exception as e:
-        logger.error(f"Error getting recent summaries: {str(e)}")
+        logger.error("Error getting recent summaries: %s", e)
         raise HTTPException(
             status_code=503,
             detail={
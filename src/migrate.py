@@ -0,0 +1,21 @@
+import os
+import logging
+
+from src.config import load_env
+from src.logging_config import setup_logging
+from src.services.database_setup import ensure_tables_exist
+
+logger = logging.getLogger(__name__)
+
+def main() -> None:
+    """Ensure the database schema once per deploy, outside the web workers."""
+    load_env()
+    setup_logging()
+
+    if os.getenv("SKIP_MIGRATIONS") == "1":
+        logger.info("SKIP_MIGRATIONS is set, not checking the schema")
+        return
+    ensure_tables_exist()
+
+if __name__ == "__main__":
+    main()
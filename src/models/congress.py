@@ -0,0 +1,35 @@
+from typing import Dict, List, TypedDict
+
+class LatestAction(TypedDict, total=False):
+    """Latest action reference in a Congress.gov payload."""
+    actionDate: str
+    text: str
+
+class Bill(TypedDict, total=False):
+    """Congress.gov bill list entry, with the detail fields the pipeline reads."""
+    congress: int
+    type: str
+    number: str
+    title: str
+    originChamber: str
+    originChamberCode: str
+    introducedDate: str
+    updateDate: str
+    updateDateIncludingText: str
+    latestAction: LatestAction
+    url: str
+    summary: str
+    actions: List[Dict]
+    amendments: Dict
+
+class Amendment(TypedDict, total=False):
+    """Congress.gov amendment, restricted to the fields the pipeline reads."""
+    congress: int
+    type: str
+    number: str
+    description: str
+    purpose: str
+    submittedDate: str
+    latestAction: LatestAction
+    chamber: str
+    url: str
@@ -1,82 +1,453 @@
 import os
 import json
+import hashlib
+import random
+import asyncio
 import logging
-from typing import Dict
-from openai import AsyncOpenAI
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import orjson
+from openai import RateLimitError
+
+from src.services.openai_client import get_async_openai_client
+from src.services.rate_limiter import AsyncTokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Model used unless OPENAI_MODEL or the constructor names another; it must
+# support json_schema structured outputs
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# Default request pacing; override with OPENAI_REQUESTS_PER_MINUTE to match the account's limit
+DEFAULT_REQUESTS_PER_MINUTE = 500
+MAX_RATE_LIMIT_RETRIES = 6
+MAX_RETRY_DELAY = 30  # seconds
+
+# Longest description sent in a prompt, roughly 15k tokens, well inside the model's context window
+MAX_DESCRIPTION_CHARS = 60_000
+
+# Most concurrent OpenAI requests per service instance
+MAX_CONCURRENT_REQUESTS = 10
+
+# Static instructions lead every user prompt and the legislation's details come
+# last, so requests share a byte-identical prefix that OpenAI can cache
+ANALYSIS_INSTRUCTIONS = """Analyze the legislation below and provide a comprehensive summary and analysis from Milton Friedman's perspective, focusing on free market principles and limited government. Format your response as JSON with the following structure:
+{
+    "summary": "A concise 2-3 sentence summary of the legislation's main points",
+    "perspective": "Milton Friedman's free market perspective",
+    "key_points": ["key point 1", "key point 2", ...],
+    "estimated_cost_impact": "Detailed analysis of fiscal impact on taxpayers and federal budget",
+    "government_growth_analysis": "Analysis of how this legislation might expand or contract government power and bureaucracy",
+    "market_impact_analysis": "Analysis of effects on market efficiency, competition, and economic freedom",
+    "liberty_impact_analysis": "Analysis of implications for individual liberty and property rights"
+}"""
+
+SYSTEM_PROMPT = """You are Milton Friedman, the economist and champion of free markets and individual liberty. Analyze legislation from that perspective with characteristic skepticism of government intervention, giving clear, data-driven analysis of its effects on economic freedom, government power, taxpayers and property rights."""
+
+# Structured output schema for one analysis; strict mode makes the model's
+# response conform to it, so the fields are always present
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "perspective": {"type": "string"},
+        "key_points": {"type": "array", "items": {"type": "string"}},
+        "estimated_cost_impact": {"type": "string"},
+        "government_growth_analysis": {"type": "string"},
+        "market_impact_analysis": {"type": "string"},
+        "liberty_impact_analysis": {"type": "string"},
+    },
+    "required": [
+        "summary",
+        "perspective",
+        "key_points",
+        "estimated_cost_impact",
+        "government_growth_analysis",
+        "market_impact_analysis",
+        "liberty_impact_analysis",
+    ],
+    "additionalProperties": False,
+}
+
+ANALYSIS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "legislation_analysis", "strict": True, "schema": ANALYSIS_SCHEMA},
+}
+
+# Completions kept in memory, keyed by a hash of the full request
+COMPLETION_CACHE_SIZE = 4096
+
+# Bills analysed per request when several summaries are requested at once;
+# kept small so every analysis fits in the model's output token limit
+BILL_BATCH_SIZE = 4
+BILL_BATCH_WINDOW = 0.5  # seconds to wait for a batch to fill
+BATCH_MAX_TOKENS = 4096
+
+BATCH_INSTRUCTIONS = """Several bills follow, each introduced by "Bill <id>:". Analyze each one separately and respond with a JSON object of the form {"results": [...]}, holding one object with the structure above per bill plus an "id" field set to the bill's id."""
+
+BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "legislation_analyses",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        **ANALYSIS_SCHEMA,
+                        "properties": {"id": {"type": "integer"}, **ANALYSIS_SCHEMA["properties"]},
+                        "required": ["id", *ANALYSIS_SCHEMA["required"]],
+                    },
+                },
+            },
+            "required": ["results"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+class _JSONFieldParser:
+    """Parse a JSON object as it streams in, returning each top-level field once its value is complete."""
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+
+    def _skip(self, pos: int, chars: str) -> int:
+        while pos < len(self._buffer) and (self._buffer[pos].isspace() or self._buffer[pos] in chars):
+            pos += 1
+        return pos
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """Add streamed text and return the fields it completed."""
+        self._buffer += text
+        fields = []
+        while True:
+            pos = self._skip(0, "{,")
+            try:
+                key, pos = self._decoder.raw_decode(self._buffer, pos)
+                pos = self._skip(pos, "")
+                if pos >= len(self._buffer) or self._buffer[pos] != ":":
+                    break
+                pos = self._skip(pos + 1, "")
+                value, end = self._decoder.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError:
+                break
+            # A number at the end of the buffer may still be growing
+            if end == len(self._buffer) and not isinstance(value, (str, list, dict)):
+                break
+            fields.append((key, value))
+            self._buffer = self._buffer[end:]
+        return fields
+
 class AIService:
     """Service for generating AI summaries and analysis."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, requests_per_minute: int = None, cache_store=None, model: str = None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         
         if not self.api_key:
             logger.error("OpenAI API key is required")
             raise ValueError("OpenAI API key is required")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
-        logger.info("Successfully initialized OpenAI client")
-
-        self.system_prompt = """You are Milton Friedman, the renowned economist and champion of free markets and individual liberty. 
-        Analyze this legislative text from your perspective, focusing on:
-        1. The potential impact on economic freedom and market efficiency
-        2. Any expansion of government power or bureaucracy
-        3. The fiscal implications and potential waste of taxpayer money
-        4. Effects on individual liberty and property rights
+        self.client = get_async_openai_client(self.api_key)
+        self.model = model or os.getenv("OPENAI_MODEL", DEFAULT_MODEL)
+        logger.info("Successfully initialized OpenAI client with model %s", self.model)
+
+        requests_per_minute = requests_per_minute or int(
+            os.getenv("OPENAI_REQUESTS_PER_MINUTE", DEFAULT_REQUESTS_PER_MINUTE)
+        )
+        self.rate_limiter = AsyncTokenBucket(requests_per_minute, 60)
+        self.concurrency = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # Micro-batching of bill summaries, started on first use
+        self._bill_queue: Optional[asyncio.Queue] = None
+        self._bill_batcher: Optional[asyncio.Task] = None
+        self._batch_tasks = set()
+
+        # Completions by prompt hash, in memory and optionally in a shared
+        # store with get_cached_completion / cache_completion methods
+        self._completion_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.cache_store = cache_store
+
+        self.system_prompt = SYSTEM_PROMPT
+
+    async def _create_completion(self, **kwargs):
+        """Create a chat completion at the configured pace, backing off on rate limit errors."""
+        for attempt in range(1, MAX_RATE_LIMIT_RETRIES + 1):
+            async with self.concurrency, self.rate_limiter:
+                try:
+                    return await self.client.chat.completions.create(**kwargs)
+                except RateLimitError:
+                    if attempt == MAX_RATE_LIMIT_RETRIES:
+                        raise
+            # Randomized exponential backoff, capped at MAX_RETRY_DELAY
+            delay = random.uniform(1, min(MAX_RETRY_DELAY, 2 ** attempt))
+            logger.warning("OpenAI rate limit hit, attempt %d of %d. Retrying in %.1f seconds...",
+                           attempt, MAX_RATE_LIMIT_RETRIES, delay)
+            await asyncio.sleep(delay)
+
+    def _bill_details(self, bill_data: Dict) -> str:
+        """Describe a bill for inclusion in a prompt."""
+        description = str(bill_data.get('summary', 'N/A'))[:MAX_DESCRIPTION_CHARS]
+        return f"""Title: {bill_data.get('title', 'N/A')}
+Description: {description}
+Latest Action: {bill_data.get('latestAction', {}).get('text', 'N/A')}"""
+
+    def _bill_prompt(self, bill_data: Dict) -> str:
+        """Build the user prompt for a bill summary."""
+        return f"{ANALYSIS_INSTRUCTIONS}\n\n{self._bill_details(bill_data)}"
+
+    def _bill_batch_prompt(self, bills: List[Dict]) -> str:
+        """Build the user prompt for summarizing several bills in one request."""
+        sections = [f"Bill {i}:\n{self._bill_details(bill)}" for i, bill in enumerate(bills, 1)]
+        return "\n\n".join([ANALYSIS_INSTRUCTIONS, BATCH_INSTRUCTIONS, *sections])
+
+    def _amendment_prompt(self, amendment_data: Dict) -> str:
+        """Build the user prompt for an amendment summary."""
+        description = str(amendment_data.get('description', 'N/A'))[:MAX_DESCRIPTION_CHARS]
+        return f"""{ANALYSIS_INSTRUCTIONS}
+
+Amendment: {amendment_data.get('type', '')} {amendment_data.get('number', '')}
+Purpose: {amendment_data.get('purpose', 'N/A')}
+Description: {description}
+Latest Action: {(amendment_data.get('latestAction') or {}).get('text', 'N/A')}"""
+
+    def bill_source_hash(self, bill_data: Dict) -> str:
+        """Hash the prompt a bill's summary is generated from, to detect unchanged inputs."""
+        text = self.model + self.system_prompt + self._bill_prompt(bill_data)
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _completion_key(self, request: Dict) -> str:
+        """Key a completion request in the completion cache."""
+        return hashlib.blake2b(orjson.dumps(request), digest_size=16).hexdigest()
+
+    def _remember_completion(self, key: str, content: str) -> None:
+        """Keep a completion in the in-memory cache, evicting the least recently used."""
+        self._completion_cache[key] = content
+        self._completion_cache.move_to_end(key)
+        if len(self._completion_cache) > COMPLETION_CACHE_SIZE:
+            self._completion_cache.popitem(last=False)
+
+    async def _cached_completion(self, key: str) -> Optional[str]:
+        """Look up a completion in memory, then in the shared store."""
+        content = self._completion_cache.get(key)
+        if content is not None:
+            self._completion_cache.move_to_end(key)
+            return content
+        if self.cache_store is None:
+            return None
+        try:
+            content = await asyncio.to_thread(self.cache_store.get_cached_completion, key)
+        except Exception as e:
+            logger.warning("Completion cache lookup failed: %s", e)
+            return None
+        if content is not None:
+            self._remember_completion(key, content)
+        return content
+
+    async def _cache_completion(self, key: str, content: str) -> None:
+        """Store a completion in memory and in the shared store."""
+        self._remember_completion(key, content)
+        if self.cache_store is None:
+            return
+        try:
+            await asyncio.to_thread(self.cache_store.cache_completion, key, content)
+        except Exception as e:
+            logger.warning("Completion cache write failed: %s", e)
+
+    def _summary_request(self, prompt: str, max_tokens: int = 2000,
+                         response_format: Dict = ANALYSIS_RESPONSE_FORMAT) -> Dict:
+        """Build the chat completion request for a summary prompt."""
+        return {
+            "model": self.model,
+            "response_format": response_format,
+            "messages": [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens
+        }
+
+    async def _generate_summary(self, prompt: str, max_tokens: int = 2000,
+                                response_format: Dict = ANALYSIS_RESPONSE_FORMAT) -> Dict:
+        """Generate a structured summary for a prompt and parse the JSON response."""
+        request = self._summary_request(prompt, max_tokens, response_format)
+        key = self._completion_key(request)
+        cached = await self._cached_completion(key)
+        if cached is not None:
+            logger.debug("Using cached completion %s", key)
+            return orjson.loads(cached)
+
+        response = await self._create_completion(**request)
+
+        # Parse the response
+        if not response.choices:
+            raise Exception("No response from OpenAI")
+        
+        summary = response.choices[0].message.content
+        if not summary:
+            raise Exception("Empty response from OpenAI")
         
-        Maintain your characteristic skepticism of government intervention while providing clear, data-driven analysis."""
+        # Structured outputs guarantee the response matches the schema
+        parsed = orjson.loads(summary)
+        await self._cache_completion(key, summary)
+        return parsed
 
-    async def generate_bill_summary(self, bill_data: Dict) -> Dict:
-        """Generate an AI summary and analysis for a bill."""
+    async def generate_bill_summaries(self, bills: List[Dict]) -> List[Optional[Dict]]:
+        """Summarize several bills in one request; bills missing from the response get None."""
+        response = await self._generate_summary(self._bill_batch_prompt(bills), max_tokens=BATCH_MAX_TOKENS,
+                                                response_format=BATCH_RESPONSE_FORMAT)
+        by_id = {}
+        for result in response.get("results", []):
+            try:
+                by_id[int(result.pop("id"))] = result
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+        return [by_id.get(i) for i in range(1, len(bills) + 1)]
+
+    async def _summarize_bill(self, bill_data: Dict) -> Dict:
+        """Generate an AI summary and analysis for a single bill."""
         try:
-            # Prepare the prompt
-            prompt = f"""Analyze the following bill and provide a comprehensive summary and analysis:
+            summary = await self._generate_summary(self._bill_prompt(bill_data))
+            logger.info("Successfully generated AI summary for bill %s", bill_data.get("title"))
+            return summary
+        except Exception as e:
+            logger.error("Error generating bill summary: %s", e)
+            raise
 
-Title: {bill_data.get('title', 'N/A')}
-Description: {bill_data.get('summary', 'N/A')}
-Latest Action: {bill_data.get('latestAction', {}).get('text', 'N/A')}
+    async def _run_bill_batcher(self) -> None:
+        """Collect queued bill summary requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._bill_queue.get()]
+            deadline = loop.time() + BILL_BATCH_WINDOW
+            try:
+                while len(batch) < BILL_BATCH_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._bill_queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                # Dispatched even when cancelled mid-window, so no caller is left waiting
+                self._dispatch_bill_batch(batch)
 
-Please provide a detailed analysis from Milton Friedman's perspective, focusing on free market principles and limited government. Format your response as JSON with the following structure:
-{{
-    "summary": "A concise 2-3 sentence summary of the bill's main points",
-    "perspective": "Milton Friedman's free market perspective",
-    "key_points": ["key point 1", "key point 2", ...],
-    "estimated_cost_impact": "Detailed analysis of fiscal impact on taxpayers and federal budget",
-    "government_growth_analysis": "Analysis of how this bill might expand or contract government power and bureaucracy",
-    "market_impact_analysis": "Analysis of effects on market efficiency, competition, and economic freedom",
-    "liberty_impact_analysis": "Analysis of implications for individual liberty and property rights"
-}}"""
-
-            # Generate the summary using GPT-4
-            response = await self.client.chat.completions.create(
-                model="gpt-4-1106-preview",
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-
-            # Parse the response
-            if not response.choices:
-                raise Exception("No response from OpenAI")
-            
-            summary = response.choices[0].message.content
-            if not summary:
-                raise Exception("Empty response from OpenAI")
-            
+    def _dispatch_bill_batch(self, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
+        """Resolve a batch in the background so the next batch can start filling."""
+        task = asyncio.create_task(self._resolve_bill_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def aclose(self) -> None:
+        """Stop the bill batcher and wait for every queued bill summary to resolve."""
+        if self._bill_batcher is None:
+            return
+        self._bill_batcher.cancel()
+        try:
+            await self._bill_batcher
+        except asyncio.CancelledError:
+            pass
+        self._bill_batcher = None
+
+        pending = []
+        while not self._bill_queue.empty():
+            pending.append(self._bill_queue.get_nowait())
+        for start in range(0, len(pending), BILL_BATCH_SIZE):
+            self._dispatch_bill_batch(pending[start:start + BILL_BATCH_SIZE])
+        await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+
+    async def _resolve_bill_batch(self, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
+        """Summarize a batch of queued bills and hand each caller its result."""
+        # Each bill is cached under its single-bill request, since batch
+        # membership depends on timing and a batch prompt rarely repeats
+        keys = [self._completion_key(self._summary_request(self._bill_prompt(bill))) for bill, _ in batch]
+        cached = await asyncio.gather(*(self._cached_completion(key) for key in keys))
+        summaries = [orjson.loads(content) if content is not None else None for content in cached]
+
+        uncached = [i for i, summary in enumerate(summaries) if summary is None]
+        if len(uncached) > 1:
             try:
-                summary_dict = json.loads(summary)
-                logger.info("Successfully generated AI summary for bill %s", bill_data.get("title"))
-                return summary_dict
-            except json.JSONDecodeError as e:
-                logger.error("Failed to parse OpenAI response: %s", str(e))
-                raise
-            
+                results = await self.generate_bill_summaries([batch[i][0] for i in uncached])
+                logger.info("Successfully generated AI summaries for %d bills in one request", len(uncached))
+            except Exception as e:
+                logger.warning("Batched bill summary failed, summarizing individually: %s", e)
+            else:
+                covered = [(i, result) for i, result in zip(uncached, results) if result is not None]
+                for i, result in covered:
+                    summaries[i] = result
+                await asyncio.gather(*(
+                    self._cache_completion(keys[i], orjson.dumps(result).decode()) for i, result in covered
+                ))
+
+        # Bills the batch didn't cover fall back to one request each
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        results = await asyncio.gather(*(self._summarize_bill(batch[i][0]) for i in missing), return_exceptions=True)
+        for i, result in zip(missing, results):
+            summaries[i] = result
+
+        for (_, future), summary in zip(batch, summaries):
+            if future.done():
+                continue
+            if isinstance(summary, BaseException):
+                future.set_exception(summary)
+            else:
+                future.set_result(summary)
+
+    async def generate_bill_summary(self, bill_data: Dict) -> Dict:
+        """Generate an AI summary and analysis for a bill, batched with concurrent requests."""
+        if self._bill_batcher is None or self._bill_batcher.done():
+            self._bill_queue = asyncio.Queue()
+            self._bill_batcher = asyncio.create_task(self._run_bill_batcher())
+        future = asyncio.get_running_loop().create_future()
+        await self._bill_queue.put((bill_data, future))
+        return await future
+
+    async def stream_bill_summary(self, bill_data: Dict) -> AsyncIterator[Tuple[str, Any]]:
+        """Generate a bill's analysis, yielding each (field, value) pair as soon as the model finishes it."""
+        request = self._summary_request(self._bill_prompt(bill_data))
+        key = self._completion_key(request)
+        cached = await self._cached_completion(key)
+        if cached is not None:
+            logger.debug("Using cached completion %s", key)
+            for field in orjson.loads(cached).items():
+                yield field
+            return
+
+        parser = _JSONFieldParser()
+        chunks = []
+        stream = await self._create_completion(**request, stream=True)
+        async for chunk in stream:
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            chunks.append(chunk.choices[0].delta.content)
+            for field in parser.feed(chunks[-1]):
+                yield field
+
+        summary = "".join(chunks)
+        if not summary:
+            raise Exception("Empty response from OpenAI")
+        # A stream cut short leaves incomplete JSON, which must not be cached
+        try:
+            orjson.loads(summary)
+        except orjson.JSONDecodeError as e:
+            logger.warning("Streamed bill summary is not valid JSON, not caching it: %s", e)
+            return
+        # Cached under the non-streaming request's key, so either path can reuse it
+        await self._cache_completion(key, summary)
+
+    async def generate_amendment_summary(self, amendment_data: Dict) -> Dict:
+        """Generate an AI summary and analysis for an amendment."""
+        try:
+            summary = await self._generate_summary(self._amendment_prompt(amendment_data))
+            logger.info("Successfully generated AI summary for amendment %s%s",
+                        amendment_data.get("type"), amendment_data.get("number"))
+            return summary
         except Exception as e:
-            logger.error("Error generating bill summary: %s", str(e))
-            raise 
\ No newline at end of file
+            logger.error("Error generating amendment summary: %s", e)
+            raise
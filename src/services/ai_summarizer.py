@@ -1,84 +1,78 @@
 import os
-from typing import Dict, List, Optional
+import logging
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
-from openai import OpenAI
+import orjson
+import tiktoken
+from src.services.ai_service import ANALYSIS_INSTRUCTIONS, ANALYSIS_RESPONSE_FORMAT, DEFAULT_MODEL, SYSTEM_PROMPT
+from src.services.openai_client import get_openai_client
+
+logger = logging.getLogger(__name__)
+
+MODEL = DEFAULT_MODEL
+
+# Tokenizer for models this tiktoken release doesn't know; it counts at least
+# as many tokens as newer encodings, so truncation stays within budget
+FALLBACK_ENCODING = "cl100k_base"
+
+# Token budget for the legislation text: the model's 128k context window minus
+# headroom for the system prompt, the analysis instructions and the response.
+MAX_INPUT_TOKENS = 100_000
+
+# Batch API jobs trade latency for half-price tokens and a separate rate limit pool
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Load the tokenizer for a model once per process."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(FALLBACK_ENCODING)
+
+def truncate_to_token_limit(text: str, max_tokens: int = MAX_INPUT_TOKENS, model: str = MODEL) -> str:
+    """Truncate text so that it encodes to at most max_tokens tokens."""
+    # Byte-level BPE tokens cover at least one UTF-8 byte each, but a single
+    # character can split into several tokens, so the shortcut counts bytes
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+    encoding = _get_encoding(model)
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
 
 class AISummarizer:
     """Service for generating AI summaries of bills and amendments."""
 
-    def __init__(self, api_key: str = None):
-        self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
-        
-        self.system_prompt = """You are Milton Friedman, the renowned economist and champion of free markets and individual liberty. 
-        Analyze this legislative text from your perspective, focusing on:
-        1. The potential impact on economic freedom and market efficiency
-        2. Any expansion of government power or bureaucracy
-        3. The fiscal implications and potential waste of taxpayer money
-        4. Effects on individual liberty and property rights
-        
-        Maintain your characteristic skepticism of government intervention while providing clear, data-driven analysis."""
-
-    def _generate_summary(self, content: str, max_tokens: int = 1000) -> Dict:
+    def __init__(self, api_key: str = None, model: str = None):
+        self.client = get_openai_client(api_key or os.getenv("OPENAI_API_KEY"))
+        self.model = model or os.getenv("OPENAI_MODEL", MODEL)
+        self.system_prompt = SYSTEM_PROMPT
+
+    def _request_body(self, content: str, max_tokens: int = 2000) -> Dict:
+        """Build a chat completion request that returns the analysis as a JSON object."""
+        return {
+            "model": self.model,
+            "response_format": ANALYSIS_RESPONSE_FORMAT,
+            "messages": [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": f"{ANALYSIS_INSTRUCTIONS}\n\n{truncate_to_token_limit(content, model=self.model)}"}
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens
+        }
+
+    def _generate_summary(self, content: str, max_tokens: int = 2000) -> Dict:
         """Generate an AI summary of the content."""
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4-1106-preview",
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": f"Please analyze this legislation:\n\n{content}"}
-                ],
-                temperature=0.7,
-                max_tokens=max_tokens
-            )
-            
-            # Extract the main points from the response
-            summary = response.choices[0].message.content
-            
-            # Generate structured analysis
-            analysis_prompt = f"""Based on the previous analysis, provide a structured response with these components:
-            1. A concise 2-3 sentence summary
-            2. Key points (bullet points)
-            3. Estimated cost impact (high/medium/low and explanation)
-            4. Government growth analysis
-            5. Market impact analysis
-            6. Liberty impact analysis"""
-            
-            structured_response = self.client.chat.completions.create(
-                model="gpt-4-1106-preview",
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "assistant", "content": summary},
-                    {"role": "user", "content": analysis_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=max_tokens
-            )
-            
-            structured_analysis = structured_response.choices[0].message.content
-            
-            # Parse the structured analysis into components
-            sections = structured_analysis.split("\n\n")
-            return {
-                "summary": sections[0].strip(),
-                "key_points": self._extract_key_points(sections[1]),
-                "estimated_cost_impact": sections[2].strip(),
-                "government_growth_analysis": sections[3].strip(),
-                "market_impact_analysis": sections[4].strip(),
-                "liberty_impact_analysis": sections[5].strip()
-            }
-            
+            response = self.client.chat.completions.create(**self._request_body(content, max_tokens))
+            return orjson.loads(response.choices[0].message.content)
         except Exception as e:
             raise Exception(f"Error generating AI summary: {str(e)}")
 
-    def _extract_key_points(self, key_points_section: str) -> List[str]:
-        """Extract key points from the bullet point section."""
-        points = []
-        for line in key_points_section.split("\n"):
-            line = line.strip()
-            if line.startswith("- ") or line.startswith("• "):
-                points.append(line[2:].strip())
-        return points
-
     def summarize_bill(self, bill_content: str) -> Dict:
         """Generate an AI summary for a bill."""
         return self._generate_summary(bill_content)
@@ -89,4 +83,46 @@ class AISummarizer:
             content = f"Original Bill:\n{original_bill_content}\n\nAmendment:\n{amendment_content}"
         else:
             content = amendment_content
-        return self._generate_summary(content)
\ No newline at end of file
+        return self._generate_summary(content)
+
+    def submit_batch(self, contents: Dict[str, str]) -> str:
+        """Submit one summary request per custom id to the Batch API and return the batch id."""
+        lines = [
+            orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": self._request_body(content)
+            })
+            for custom_id, content in contents.items()
+        ]
+        batch_file = self.client.files.create(file=("summaries.jsonl", b"\n".join(lines)), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
+        logger.info("Submitted batch %s with %d summary requests", batch.id, len(lines))
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> Tuple[str, Optional[Dict[str, Dict]]]:
+        """Return a batch's status and, once it has completed, its summaries by custom id."""
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status != "completed" or not batch.output_file_id:
+            return batch.status, None
+
+        summaries = {}
+        for line in self.client.files.content(batch.output_file_id).iter_lines():
+            if not line:
+                continue
+            try:
+                result = orjson.loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") != 200:
+                    logger.warning("Batch request %s failed: %s", result.get("custom_id"), result.get("error"))
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                summaries[result["custom_id"]] = orjson.loads(content)
+            except (KeyError, IndexError, orjson.JSONDecodeError) as e:
+                logger.warning("Skipping unreadable batch result in %s: %s", batch_id, e)
+        return batch.status, summaries
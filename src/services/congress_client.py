@@ -1,107 +1,289 @@
 import os
+import random
+import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Optional, List
-import requests
-from requests.exceptions import HTTPError
+from typing import AsyncIterator, Dict, Optional, List, Tuple
+import httpx
+import orjson
+
+from src.services.rate_limiter import AsyncTokenBucket
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = "https://api.congress.gov/v3"
+
+# Connection limits for the shared client, sized above the pipeline's concurrency
+MAX_CONNECTIONS = 50
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+# Large bill and amendment listings can take longer than httpx's 5 second
+# default; timing out early only spends a retry and a rate limit token
+REQUEST_TIMEOUT = 10  # seconds
+
+# Congress.gov allows 5,000 requests per hour per key; override with
+# CONGRESS_REQUESTS_PER_HOUR for keys with a different limit
+DEFAULT_REQUESTS_PER_HOUR = 5000
+MAX_CONCURRENT_REQUESTS = 5
+# Requests allowed back to back before pacing starts; a full hourly bucket
+# would let the whole quota out in the first few minutes
+REQUEST_BURST = 10
+MAX_REQUEST_RETRIES = 5
+MAX_RETRY_DELAY = 30  # seconds
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Most amendments the bill amendments listing returns per request
+AMENDMENT_PAGE_LIMIT = 250
+
+# Largest page the Congress.gov list endpoints serve
+UPDATES_PAGE_SIZE = 250
+
+# Detail responses kept for conditional revalidation, keyed by endpoint and
+# params; bounded by count and by the total size of the cached bodies
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+def _is_cacheable(endpoint: str) -> bool:
+    """Whether an endpoint is a single bill or amendment resource rather than a listing.
+
+    Listings such as bill/{congress} are queried with a fromDateTime that changes
+    every cycle, so their cached copies would never be revalidated.
+    """
+    return endpoint.count("/") >= 3
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    """Seconds to wait before retrying, preferring the server's Retry-After header."""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    # Randomized exponential backoff, capped at MAX_RETRY_DELAY
+    return random.uniform(1, min(MAX_RETRY_DELAY, 2 ** attempt))
+
 class CongressClient:
     """Client for interacting with the Congress.gov API."""
 
-    def __init__(self, api_key: str = None):
-        self.base_url = "https://api.congress.gov/v3"
+    def __init__(self, api_key: str = None, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 requests_per_hour: int = None):
+        self.base_url = os.getenv("CONGRESS_API_BASE_URL", DEFAULT_BASE_URL)
         self.api_key = api_key or os.getenv("CONGRESS_API_KEY")
-        
+
         if not self.api_key:
             logger.error("Congress.gov API key is required")
             raise ValueError("Congress.gov API key is required")
-        
+
+        # One client for the instance's lifetime so connections are reused;
+        # HTTP/2 lets concurrent requests share a single TLS connection.
+        # httpx asks for gzip, plus brotli when the brotli extra is installed,
+        # and decodes either transparently, so JSON crosses the wire compressed
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"X-Api-Key": self.api_key},
+            params={"format": "json"},
+            http2=True,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+            ),
+            transport=transport
+        )
+
+        # Requests are paced to the key's hourly quota and capped in flight,
+        # so concurrent callers queue here instead of tripping 429s
+        requests_per_hour = requests_per_hour or int(
+            os.getenv("CONGRESS_REQUESTS_PER_HOUR", DEFAULT_REQUESTS_PER_HOUR)
+        )
+        self.rate_limiter = AsyncTokenBucket(requests_per_hour, 3600, capacity=REQUEST_BURST)
+        self.concurrency = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # Validators and bodies of earlier responses; unchanged resources are
+        # revalidated with a conditional GET and come back as an empty 304
+        self._response_cache: "OrderedDict[Tuple, Tuple[Dict, bytes]]" = OrderedDict()
+        self._response_cache_bytes = 0
+
         logger.info("Successfully initialized Congress.gov API client with base URL: %s", self.base_url)
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._client.aclose()
+
+    async def _get(self, endpoint: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> httpx.Response:
+        """GET an endpoint at the configured pace, retrying rate limits, server errors and dropped connections."""
+        for attempt in range(1, MAX_REQUEST_RETRIES + 1):
+            response = None
+            async with self.concurrency, self.rate_limiter:
+                try:
+                    response = await self._client.get(f"/{endpoint}", params=params, headers=headers)
+                    if response.status_code == 304:
+                        return response
+                    if response.status_code not in RETRYABLE_STATUS_CODES or attempt == MAX_REQUEST_RETRIES:
+                        response.raise_for_status()
+                        return response
+                except httpx.TransportError:
+                    if attempt == MAX_REQUEST_RETRIES:
+                        raise
+            delay = _retry_delay(response, attempt)
+            logger.warning("Congress.gov request to %s failed with status %s, attempt %d of %d. Retrying in %.1f seconds...",
+                           endpoint, getattr(response, "status_code", "N/A"), attempt, MAX_REQUEST_RETRIES, delay)
+            await asyncio.sleep(delay)
+
+    async def _get_content(self, endpoint: str, params: Optional[Dict] = None) -> bytes:
+        """Return an endpoint's body, revalidating a cached copy with its ETag or Last-Modified date when there is one."""
+        if not _is_cacheable(endpoint):
+            return (await self._get(endpoint, params)).content
+
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._response_cache.get(key)
+        response = await self._get(endpoint, params, cached[0] if cached else None)
+
+        if response.status_code == 304 and cached:
+            logger.debug("Congress.gov response for %s not modified", endpoint)
+            self._response_cache.move_to_end(key)
+            return cached[1]
+
+        self._uncache(key)
+        validators = {}
+        if "ETag" in response.headers:
+            validators["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        if validators and len(response.content) <= RESPONSE_CACHE_MAX_BYTES:
+            self._response_cache[key] = (validators, response.content)
+            self._response_cache_bytes += len(response.content)
+            while (len(self._response_cache) > RESPONSE_CACHE_SIZE
+                   or self._response_cache_bytes > RESPONSE_CACHE_MAX_BYTES):
+                self._uncache(next(iter(self._response_cache)))
+        return response.content
+
+    def _uncache(self, key: Tuple) -> None:
+        """Drop a cached response, if there is one."""
+        cached = self._response_cache.pop(key, None)
+        if cached:
+            self._response_cache_bytes -= len(cached[1])
+
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Make a request to the Congress.gov API."""
         try:
-            # Ensure params dictionary exists
-            params = params or {}
-            
-            # Add API key and format to params
-            params.update({
-                "api_key": self.api_key,
-                "format": "json"
-            })
-            
-            url = f"{self.base_url}/{endpoint}"
-            logger.info("Making request to Congress.gov API: %s with params: %s", url, {k: v for k, v in params.items() if k != 'api_key'})
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info("Successfully received response from Congress.gov API for endpoint: %s", endpoint)
-            logger.debug("Response data: %s", data)
-            
+            logger.debug("Making request to Congress.gov API: %s with params: %s", endpoint, params)
+
+            content = await self._get_content(endpoint, params)
+
+            data = orjson.loads(content)
+            logger.debug("Successfully received response from Congress.gov API for endpoint: %s", endpoint)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response data: %s", data)
+
             return data
-        except requests.exceptions.RequestException as e:
-            logger.error("Error fetching data from Congress.gov: %s", str(e))
-            logger.error("Failed URL: %s", url)
-            logger.error("Response status code: %s", getattr(e.response, 'status_code', 'N/A'))
-            logger.error("Response text: %s", getattr(e.response, 'text', 'N/A'))
+        except httpx.HTTPError as e:
+            response = getattr(e, "response", None)
+            logger.error("Error fetching data from Congress.gov: %s", e)
+            logger.error("Failed endpoint: %s", endpoint)
+            logger.error("Response status code: %s", getattr(response, 'status_code', 'N/A'))
+            logger.error("Response text: %s", getattr(response, 'text', 'N/A'))
             raise
 
-    def get_recent_bills(self, congress: int, limit: int = 20) -> Dict:
+    async def get_recent_bills(self, congress: int, limit: int = 20) -> Dict:
         """Get recent bills for a specific Congress."""
         logger.info("Fetching recent bills for Congress %d with limit %d", congress, limit)
-        return self._make_request(f"bill/{congress}", {"limit": limit})
+        return await self._make_request(f"bill/{congress}", {"limit": limit})
+
+    async def iter_recent_bills(self, congress: int, limit: int = 50, page_size: int = 25) -> AsyncIterator[Dict]:
+        """Yield up to limit recent bills for a specific Congress, fetching one page at a time."""
+        offset = 0
+        while offset < limit:
+            page_limit = min(page_size, limit - offset)
+            logger.debug("Fetching recent bills for Congress %d at offset %d", congress, offset)
+            page = await self._make_request(f"bill/{congress}", {"limit": page_limit, "offset": offset})
+            bills = page.get("bills", [])
+            for bill in bills:
+                yield bill
+            if len(bills) < page_limit:
+                return
+            offset += page_limit
 
-    def get_bill_details(self, congress: int, bill_type: str, bill_number: str) -> Dict:
+    async def get_bill_details(self, congress: int, bill_type: str, bill_number: str) -> Dict:
         """Get detailed information about a specific bill."""
-        logger.info("Fetching details for bill %s%s in Congress %d", bill_type, bill_number, congress)
-        return self._make_request(f"bill/{congress}/{bill_type}/{bill_number}")
-
-    def get_bill_amendments(self, congress: int, bill_type: str, bill_number: str) -> List[Dict]:
-        """Fetch all amendments for a specific bill."""
-        logger.info("Fetching amendments for bill %s%s in Congress %d", bill_type, bill_number, congress)
-        # First, fetch the bill details to get amendment links or identifiers
-        bill_endpoint = f"bill/{congress}/{bill_type.lower()}/{bill_number}"
+        logger.debug("Fetching details for bill %s%s in Congress %d", bill_type, bill_number, congress)
+        return await self._make_request(f"bill/{congress}/{bill_type}/{bill_number}")
+
+    async def get_bill_amendments(self, congress: int, bill_type: str, bill_number: str,
+                                  bill_data: Optional[Dict] = None) -> List[Dict]:
+        """Fetch all amendments for a specific bill, skipping the listing request when bill_data shows there are none."""
+        logger.debug("Fetching amendments for bill %s%s in Congress %d", bill_type, bill_number, congress)
         try:
-            bill_response = self._make_request(bill_endpoint)
-            bill_data = bill_response.get("bill", {})
-            amendments = bill_data.get("amendments", [])
-            
+            # Bill details only carry a {count, url} reference to the list
+            reference = bill_data.get("amendments") if bill_data is not None else None
+            if isinstance(reference, list):
+                amendments = reference
+            elif bill_data is not None and not (reference or {}).get("count"):
+                amendments = []
+            else:
+                # Heavily amended bills list more than one page
+                amendments = []
+                offset = 0
+                while True:
+                    listing = await self._make_request(
+                        f"bill/{congress}/{bill_type.lower()}/{bill_number}/amendments",
+                        {"limit": AMENDMENT_PAGE_LIMIT, "offset": offset}
+                    )
+                    amendments.extend(listing.get("amendments", []))
+                    if not (listing.get("pagination") or {}).get("next"):
+                        break
+                    offset += AMENDMENT_PAGE_LIMIT
+
             if not amendments:
-                logger.info("No amendments found for bill %s%s in Congress %d", bill_type, bill_number, congress)
+                logger.debug("No amendments found for bill %s%s in Congress %d", bill_type, bill_number, congress)
                 return []
 
-            amendment_details = []
+            identified = []
+            seen = set()
+            duplicates = 0
             for amendment in amendments:
-                amendment_type = amendment.get("type")
-                amendment_number = amendment.get("number")
-                if not (amendment_type and amendment_number):
+                if not (amendment.get("type") and amendment.get("number")):
                     logger.warning("Amendment missing type or number: %s", amendment)
                     continue
-                amendment_endpoint = f"amendment/{congress}/{amendment_type}/{amendment_number}"
-                try:
-                    amendment_response = self._make_request(amendment_endpoint)
-                    amendment_data = amendment_response.get("amendment", {})
-                    amendment_details.append(amendment_data)
-                except HTTPError as http_err:
-                    if http_err.response.status_code == 404:
+                # The listing can repeat amendments; fetch each one only once
+                key = (amendment["type"], amendment["number"])
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                identified.append(amendment)
+            if duplicates:
+                logger.warning("Skipped %d duplicate amendments for bill %s%s in Congress %d",
+                               duplicates, bill_type, bill_number, congress)
+
+            # Fetch every amendment's details concurrently over the shared client
+            results = await asyncio.gather(
+                *(self._make_request(f"amendment/{congress}/{a['type']}/{a['number']}") for a in identified),
+                return_exceptions=True
+            )
+
+            amendment_details = []
+            for amendment, result in zip(identified, results):
+                amendment_type = amendment["type"]
+                amendment_number = amendment["number"]
+                if isinstance(result, httpx.HTTPStatusError):
+                    if result.response.status_code == 404:
                         logger.warning("Amendment %s%s not found in Congress %d", amendment_type, amendment_number, congress)
-                        continue
                     else:
                         logger.error("HTTP error occurred while fetching amendment %s%s: %s",
-                                     amendment_type, amendment_number, http_err)
-                        continue
-                except Exception as err:
+                                     amendment_type, amendment_number, result)
+                    continue
+                if isinstance(result, Exception):
                     logger.error("An error occurred while fetching amendment %s%s: %s",
-                                 amendment_type, amendment_number, err)
+                                 amendment_type, amendment_number, result)
                     continue
+                # Keep the listing entry if the details response lacks the amendment
+                amendment_details.append(result.get("amendment") or amendment)
 
             return amendment_details
 
-        except HTTPError as http_err:
+        except httpx.HTTPStatusError as http_err:
             if http_err.response.status_code == 404:
                 logger.warning("Bill %s%s not found in Congress %d", bill_type, bill_number, congress)
                 return []
@@ -112,13 +294,31 @@ class CongressClient:
             logger.error("An error occurred while fetching bill %s%s: %s", bill_type, bill_number, err)
             return []
 
-    def get_amendment_details(self, congress: int, amendment_type: str, amendment_number: int) -> Dict:
+    async def get_amendment_details(self, congress: int, amendment_type: str, amendment_number: int) -> Dict:
         """Get detailed information about a specific amendment."""
-        logger.info("Fetching details for amendment %s%d in Congress %d", amendment_type, amendment_number, congress)
-        return self._make_request(f"amendment/{congress}/{amendment_type}/{amendment_number}")
+        logger.debug("Fetching details for amendment %s%d in Congress %d", amendment_type, amendment_number, congress)
+        return await self._make_request(f"amendment/{congress}/{amendment_type}/{amendment_number}")
 
-    def get_updates_since(self, since_date: datetime) -> Dict:
-        """Get bills and amendments updated since a specific date."""
+    async def iter_updates_since(self, since_date: datetime, congress: Optional[int] = None,
+                                 page_size: int = UPDATES_PAGE_SIZE) -> AsyncIterator[Dict]:
+        """Yield every bill updated since a specific date, oldest update first."""
         formatted_date = since_date.strftime("%Y-%m-%dT%H:%M:%SZ")
         logger.info("Fetching updates since %s", formatted_date)
-        return self._make_request("bill", {"fromDateTime": formatted_date}) 
\ No newline at end of file
+        endpoint = f"bill/{congress}" if congress else "bill"
+        offset = 0
+        while True:
+            page = await self._make_request(endpoint, {
+                "fromDateTime": formatted_date,
+                "sort": "updateDate asc",
+                "limit": page_size,
+                "offset": offset
+            })
+            for bill in page.get("bills", []):
+                yield bill
+            if not (page.get("pagination") or {}).get("next"):
+                return
+            offset += page_size
+
+    async def get_updates_since(self, since_date: datetime) -> Dict:
+        """Get bills and amendments updated since a specific date."""
+        return {"bills": [bill async for bill in self.iter_updates_since(since_date)]}
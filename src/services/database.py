@@ -1,210 +1,502 @@
-import os
+import time
+import uuid
 import logging
-from datetime import datetime
-from typing import Dict, Optional, List
-import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, List, Tuple, TypedDict
+import httpx
+import orjson
+import psycopg2
+import psycopg2.errors
+from postgrest.exceptions import APIError
+from postgrest.types import ReturnMethod
+from postgrest.utils import SyncClient
 from supabase import create_client, Client
 
+from src.database.bulk import bulk_upsert
+from src.database.connection import pooled_connection, pooled_database_url
+
 logger = logging.getLogger(__name__)
 
+# SQLSTATE of foreign key violations, which the validate_target_id trigger
+# also raises for summaries and statuses whose target does not exist
+FOREIGN_KEY_VIOLATION = "23503"
+
+# Rows per request for bulk upserts, keeping request bodies well under PostgREST limits
+BULK_UPSERT_BATCH_SIZE = 500
+
+# Ids per in_ filter, keeping lookups over an unbounded set of ids within
+# PostgREST URL length limits
+IN_FILTER_SIZE = 200
+
+# Connections the shared PostgREST session may open; with HTTP/2 each one
+# carries many concurrent requests
+POSTGREST_MAX_CONNECTIONS = 10
+
+# Bill and amendment detail reads kept in memory, keyed by id. Writes made
+# through this service evict the entries they touch, but only in the writing
+# process; the worker process writes bills, so the short TTL bounds how long
+# web processes serve stale reads
+READ_CACHE_SIZE = 4096
+READ_CACHE_TTL = 30  # seconds
+
+# OpenAI batch statuses that can still change
+OPEN_BATCH_STATUSES = ("validating", "in_progress", "finalizing", "cancelling")
+
+# UUIDv5 namespaces for ids derived from natural keys; must match the
+# bill_uuid / amendment_uuid functions in the 0009 migration
+BILL_ID_NAMESPACE = uuid.UUID("121e6022-a8eb-4dbf-8348-11209eb71f33")
+AMENDMENT_ID_NAMESPACE = uuid.UUID("c629c3b3-da0f-4ace-8d34-889d6c087de6")
+
+# Columns of a bill or amendment shown alongside a summary; the large
+# description and actions columns are left out so they aren't detoasted
+BILL_LISTING_COLUMNS = "id,congress_number,bill_type,bill_number,title,latest_action_date,latest_action_text,update_date,url"
+AMENDMENT_LISTING_COLUMNS = "id,bill_id,congress_number,amendment_type,amendment_number,purpose,latest_action_date,latest_action_text,url"
+
+# Columns read when queueing bills and amendments for summarization; the
+# actions history is never part of a prompt
+BILL_PROCESSING_COLUMNS = "id,congress_number,bill_type,bill_number,title,description,latest_action_text,update_date,updated_at"
+AMENDMENT_PROCESSING_COLUMNS = "id,bill_id,congress_number,amendment_type,amendment_number,description,purpose,latest_action_text,updated_at"
+
+# Columns of an AI summary served by the API
+SUMMARY_COLUMNS = "id,target_id,target_type,summary,perspective,key_points,estimated_cost_impact,government_growth_analysis,market_impact_analysis,liberty_impact_analysis,created_at,updated_at"
+
+class BillRow(TypedDict, total=False):
+    """Row of the bills table."""
+    id: str
+    congress_number: int
+    bill_type: str
+    bill_number: int
+    title: Optional[str]
+    description: str
+    origin_chamber: Optional[str]
+    origin_chamber_code: Optional[str]
+    introduced_date: Optional[str]
+    latest_action_date: Optional[str]
+    latest_action_text: Optional[str]
+    update_date: Optional[str]
+    url: Optional[str]
+    actions: List[Dict]
+
+class AmendmentRow(TypedDict, total=False):
+    """Row of the amendments table."""
+    id: str
+    bill_id: str
+    congress_number: int
+    amendment_type: str
+    amendment_number: int
+    description: str
+    purpose: str
+    submitted_date: Optional[str]
+    latest_action_date: Optional[str]
+    latest_action_text: Optional[str]
+    chamber: Optional[str]
+    url: Optional[str]
+
+class AISummaryRow(TypedDict, total=False):
+    """Row of the ai_summaries table."""
+    target_id: str
+    target_type: str
+    source_text_sha256: Optional[str]
+    summary: str
+    perspective: str
+    key_points: List[str]
+    estimated_cost_impact: str
+    government_growth_analysis: str
+    market_impact_analysis: str
+    liberty_impact_analysis: str
+
+class ProcessingStatusRow(TypedDict, total=False):
+    """Row of the processing_status table."""
+    target_id: str
+    target_type: str
+    status: str
+    error_message: Optional[str]
+    source_update_date: Optional[str]
+    last_processed: Any
+
+def bill_uuid(congress: int, bill_type: str, bill_number: int) -> str:
+    """Return the deterministic id of a bill."""
+    return str(uuid.uuid5(BILL_ID_NAMESPACE, f"{congress}-{bill_type}-{bill_number}"))
+
+def amendment_uuid(congress: int, amendment_type: str, amendment_number: int) -> str:
+    """Return the deterministic id of an amendment."""
+    return str(uuid.uuid5(AMENDMENT_ID_NAMESPACE, f"{congress}-{amendment_type}-{amendment_number}"))
+
+def _json_default(value: Any) -> Any:
+    """Encode the column types orjson doesn't handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError
+
+class _ORJSONSyncClient(SyncClient):
+    """PostgREST session that encodes request bodies and decodes responses with orjson."""
+
+    def request(self, method: str, url, *, json: Any = None, **kwargs) -> httpx.Response:
+        if json is not None:
+            # orjson writes datetimes, nested ones included, as ISO 8601 strings;
+            # the session's headers already declare application/json
+            kwargs["content"] = orjson.dumps(json, default=_json_default)
+        response = super().request(method, url, **kwargs)
+        # postgrest-py decodes every result with response.json(); orjson's
+        # JSONDecodeError subclasses the stdlib one it catches for empty bodies
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+@lru_cache(maxsize=None)
+def get_supabase_client(url: str, key: str) -> Client:
+    """Return the process-wide Supabase client for a project, creating it on first use."""
+    # The client keeps one PostgREST session, so sharing it lets every
+    # DatabaseService reuse the same keep-alive connections
+    client = create_client(url, key)
+
+    # Queries run concurrently from worker threads; over HTTP/2 they are
+    # multiplexed on one TLS connection instead of queueing for HTTP/1.1 ones
+    session = client.postgrest.session
+    client.postgrest.session = _ORJSONSyncClient(
+        base_url=session.base_url,
+        headers=session.headers,
+        timeout=session.timeout,
+        http2=True,
+        limits=httpx.Limits(max_connections=POSTGREST_MAX_CONNECTIONS)
+    )
+    session.close()
+    return client
+
+class TargetMissingError(Exception):
+    """Raised when a write references a bill or amendment that does not exist."""
+
 class DatabaseService:
     """Service for interacting with the Supabase database."""
 
     def __init__(self, url: str, key: str):
         """Initialize the database service with Supabase credentials."""
-        self.client = create_client(url, key)
+        self.client = get_supabase_client(url, key)
+        # Bulk writes go straight to Postgres when a connection string is configured
+        self.direct_ingest = bool(pooled_database_url())
+
+        self._read_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._read_cache_lock = threading.Lock()
         logger.info("Successfully connected to Supabase at %s", url)
 
-    def _serialize_datetime(self, data: Dict) -> Dict:
-        """Convert datetime objects to ISO format strings."""
-        serialized = data.copy()
-        for key, value in serialized.items():
-            if isinstance(value, datetime):
-                serialized[key] = value.isoformat()
-        return serialized
+    def _cached_read(self, key: str, load: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """Return a fresh cached read, or load it and cache the result if one was found."""
+        now = time.monotonic()
+        with self._read_cache_lock:
+            entry = self._read_cache.get(key)
+            if entry and entry[0] > now:
+                self._read_cache.move_to_end(key)
+                return entry[1]
+        value = load()
+        if value is not None:
+            with self._read_cache_lock:
+                self._read_cache[key] = (now + READ_CACHE_TTL, value)
+                self._read_cache.move_to_end(key)
+                if len(self._read_cache) > READ_CACHE_SIZE:
+                    self._read_cache.popitem(last=False)
+        return value
+
+    def _evict_reads(self, keys: Iterable[Optional[str]]) -> None:
+        """Drop cached reads made stale by a write."""
+        with self._read_cache_lock:
+            for key in keys:
+                self._read_cache.pop(key, None)
 
     def upsert_bill(self, bill_data: Dict) -> Dict:
         """Insert or update a bill in the database."""
+        stored = self.bulk_upsert_bills([bill_data])
+        if not stored:
+            raise Exception("No data returned from bill upsert")
+        return stored[0]
+
+    def _bulk_upsert(self, table: str, rows: List[Dict], on_conflict: str, returning: bool = True) -> List[Dict]:
+        """Upsert rows in batches, issuing one INSERT ... ON CONFLICT request per batch.
+
+        With returning=False the database skips sending the stored rows back and an empty list is returned.
+        Rows referencing a missing bill or amendment raise TargetMissingError.
+        """
+        if not rows:
+            return []
         try:
-            # Serialize datetime objects before sending to Supabase
-            bill_data = self._serialize_datetime(bill_data)
-            
-            # First, insert/update the bill
-            result = self.client.table("bills").upsert(
-                bill_data,
-                on_conflict="congress_number,bill_type,bill_number"
-            ).execute()
-            if result.data:
-                logger.info("Successfully upserted bill %s%s", bill_data.get("bill_type"), bill_data.get("bill_number"))
-                return result.data[0]
-            else:
-                raise Exception("No data returned from bill upsert")
+            return self._upsert_batches(table, rows, on_conflict, returning)
+        except psycopg2.errors.ForeignKeyViolation as e:
+            raise TargetMissingError(str(e).strip()) from e
+        except APIError as e:
+            if e.code == FOREIGN_KEY_VIOLATION:
+                raise TargetMissingError(e.message) from e
+            raise
+
+    def _upsert_batches(self, table: str, rows: List[Dict], on_conflict: str, returning: bool) -> List[Dict]:
+        """Send an upsert over the direct connection when configured, otherwise through PostgREST."""
+        if self.direct_ingest:
+            try:
+                return self._direct_bulk_upsert(table, rows, returning)
+            except psycopg2.OperationalError as e:
+                logger.warning("Direct database connection failed, upserting %s through PostgREST: %s", table, e)
+        # Prefer: return=minimal when the caller has no use for the stored rows
+        return_method = ReturnMethod.representation if returning else ReturnMethod.minimal
+        stored = []
+        for start in range(0, len(rows), BULK_UPSERT_BATCH_SIZE):
+            batch = rows[start:start + BULK_UPSERT_BATCH_SIZE]
+            result = self.client.table(table).upsert(batch, on_conflict=on_conflict, returning=return_method).execute()
+            stored.extend(result.data or [])
+        return stored
+
+    def _direct_bulk_upsert(self, table: str, rows: List[Dict], returning: bool = True) -> List[Dict]:
+        """Upsert rows over a pooled Postgres connection, one statement per page of rows."""
+        with pooled_connection() as conn:
+            stored = bulk_upsert(conn, table, rows, page_size=BULK_UPSERT_BATCH_SIZE, returning=returning)
+        # Match PostgREST's JSON output: ids, dates and numerics as JSON values
+        return orjson.loads(orjson.dumps(stored, default=_json_default))
+
+    def bulk_upsert_bills(self, bills: List[BillRow], returning: bool = True) -> List[Dict]:
+        """Insert or update many bills in as few requests as possible."""
+        try:
+            stored = self._bulk_upsert("bills", bills, "congress_number,bill_type,bill_number", returning)
+            self._evict_reads(bill.get("id") for bill in (stored if returning else bills))
+            logger.info("Successfully upserted %d bills", len(bills))
+            return stored
         except Exception as e:
-            logger.error("Error upserting bill: %s", str(e))
+            logger.error("Error bulk upserting bills: %s", e)
             raise
 
-    def upsert_amendment(self, amendment_data: Dict) -> Dict:
-        """Insert or update an amendment in the database."""
+    def bulk_upsert_amendments(self, amendments: List[AmendmentRow], returning: bool = True) -> List[Dict]:
+        """Insert or update many amendments in as few requests as possible."""
         try:
-            # Serialize datetime objects before sending to Supabase
-            amendment_data = self._serialize_datetime(amendment_data)
-            
-            # First, insert/update the amendment
-            result = self.client.table("amendments").upsert(
-                amendment_data,
-                on_conflict="congress_number,amendment_type,amendment_number"
-            ).execute()
-            if result.data:
-                logger.info("Successfully upserted amendment %s", amendment_data.get("amendment_number"))
-                return result.data[0]
-            else:
-                raise Exception("No data returned from amendment upsert")
+            stored = self._bulk_upsert("amendments", amendments,
+                                       "congress_number,amendment_type,amendment_number", returning)
+            # A bill's cached details list its amendments
+            written = stored if returning else amendments
+            self._evict_reads(amendment.get("id") for amendment in written)
+            self._evict_reads(amendment.get("bill_id") for amendment in written)
+            logger.info("Successfully upserted %d amendments", len(amendments))
+            return stored
         except Exception as e:
-            logger.error("Error upserting amendment: %s", str(e))
+            logger.error("Error bulk upserting amendments: %s", e)
             raise
 
+    def bulk_upsert_ai_summaries(self, summaries: List[AISummaryRow], returning: bool = True) -> List[Dict]:
+        """Insert or update many AI summaries in as few requests as possible."""
+        try:
+            # Targets are not probed one by one as in upsert_ai_summary; the
+            # validate_target_id trigger rejects summaries for missing targets
+            stored = self._bulk_upsert("ai_summaries", summaries, "target_id,target_type", returning)
+            self._evict_reads(summary["target_id"] for summary in summaries)
+            logger.info("Successfully upserted %d AI summaries", len(summaries))
+            return stored
+        except Exception as e:
+            logger.error("Error bulk upserting AI summaries: %s", e)
+            raise
+
+    def bulk_update_processing_status(self, statuses: List[ProcessingStatusRow], returning: bool = True) -> List[Dict]:
+        """Insert or update many processing status records in as few requests as possible."""
+        try:
+            stored = self._bulk_upsert("processing_status", statuses, "target_id,target_type", returning)
+            logger.info("Successfully updated %d processing statuses", len(statuses))
+            return stored
+        except Exception as e:
+            logger.error("Error bulk updating processing status: %s", e)
+            raise
+
+    def upsert_amendment(self, amendment_data: Dict) -> Dict:
+        """Insert or update an amendment in the database."""
+        stored = self.bulk_upsert_amendments([amendment_data])
+        if not stored:
+            raise Exception("No data returned from amendment upsert")
+        return stored[0]
+
+    def _check_target(self, data: Dict) -> None:
+        """Reject rows without a valid target before sending them."""
+        if not data.get("target_type") or not data.get("target_id"):
+            raise ValueError("Missing target_type or target_id")
+        if data["target_type"] not in ("bill", "amendment"):
+            raise ValueError(f"Invalid target_type: {data['target_type']}")
+
     def upsert_ai_summary(self, summary_data: Dict) -> Dict:
         """Insert or update an AI summary in the database."""
         try:
-            # Serialize datetime objects before sending to Supabase
-            summary_data = self._serialize_datetime(summary_data)
-            
-            # First, check if the target exists
-            target_type = summary_data.get("target_type")
-            target_id = summary_data.get("target_id")
-            
-            if not target_type or not target_id:
-                raise ValueError("Missing target_type or target_id in summary data")
-            
-            # Validate target exists before attempting to create summary
-            try:
-                if target_type == "bill":
-                    target = self.client.table("bills").select("id").eq("id", target_id).single().execute()
-                elif target_type == "amendment":
-                    target = self.client.table("amendments").select("id").eq("id", target_id).single().execute()
-                else:
-                    raise ValueError(f"Invalid target_type: {target_type}")
-                
-                if not target.data:
-                    raise ValueError(f"Target {target_type} with ID {target_id} does not exist in the database")
-            except Exception as e:
-                logger.error(f"Error validating {target_type} existence: {str(e)}")
-                raise ValueError(f"Failed to validate {target_type} existence: {str(e)}")
-            
-            # Then, insert/update the AI summary
-            result = self.client.table("ai_summaries").upsert(
-                summary_data,
-                on_conflict="target_id,target_type"
-            ).execute()
-            
-            if result.data:
-                logger.info("Successfully upserted AI summary for %s %s", target_type, target_id)
-                return result.data[0]
-            else:
+            # The target's existence is enforced by the validate_target_id
+            # trigger, so a missing target raises TargetMissingError without
+            # a separate lookup
+            self._check_target(summary_data)
+            stored = self.bulk_upsert_ai_summaries([summary_data])
+            if not stored:
                 raise Exception("No data returned from AI summary upsert")
+            return stored[0]
         except Exception as e:
-            logger.error("Error upserting AI summary: %s", str(e))
+            logger.error("Error upserting AI summary: %s", e)
             raise
 
     def update_processing_status(self, status_data: Dict) -> Dict:
         """Update the processing status of a bill or amendment."""
         try:
-            # Serialize datetime objects before sending to Supabase
-            status_data = self._serialize_datetime(status_data)
-            
-            # First, check if the target exists
-            target_type = status_data.get("target_type")
-            target_id = status_data.get("target_id")
-            
-            if target_type == "bill":
-                target = self.client.table("bills").select("id").eq("id", target_id).single().execute()
-            else:  # target_type == "amendment"
-                target = self.client.table("amendments").select("id").eq("id", target_id).single().execute()
-            
-            if not target.data:
-                raise Exception(f"Target {target_type} with ID {target_id} not found")
-            
-            # Then, insert/update the processing status
-            result = self.client.table("processing_status").upsert(
-                status_data,
-                on_conflict="target_id,target_type"
-            ).execute()
-            if result.data:
-                logger.info("Successfully updated processing status for %s %s", target_type, target_id)
-                return result.data[0]
-            else:
+            self._check_target(status_data)
+            stored = self.bulk_update_processing_status([status_data])
+            if not stored:
                 raise Exception("No data returned from processing status upsert")
+            return stored[0]
         except Exception as e:
-            logger.error("Error updating processing status: %s", str(e))
+            logger.error("Error updating processing status: %s", e)
             raise
 
-    def get_bills_for_processing(self, limit: int = 100) -> List[Dict]:
-        """Get bills that need to be processed or updated."""
+    def get_processed_update_dates(self, congress: int, bill_numbers: List[int]) -> Dict[tuple, str]:
+        """Map (congress, bill_type, bill_number) to the updateDate each bill was last summarized at."""
         try:
-            result = (self.client.table("bills")
-                    .select("*")
+            if not bill_numbers:
+                return {}
+            keys = {}
+            for start in range(0, len(bill_numbers), IN_FILTER_SIZE):
+                bills = (self.client.table("bills")
+                        .select("id,bill_type,bill_number")
+                        .eq("congress_number", congress)
+                        .in_("bill_number", bill_numbers[start:start + IN_FILTER_SIZE])
+                        .execute())
+                keys.update((bill["id"], (congress, bill["bill_type"], bill["bill_number"])) for bill in bills.data or [])
+            if not keys:
+                return {}
+
+            bill_ids = list(keys)
+            update_dates = {}
+            for start in range(0, len(bill_ids), IN_FILTER_SIZE):
+                statuses = (self.client.table("processing_status")
+                           .select("target_id,source_update_date")
+                           .eq("target_type", "bill")
+                           .eq("status", "completed")
+                           .in_("target_id", bill_ids[start:start + IN_FILTER_SIZE])
+                           .execute())
+                update_dates.update(
+                    (keys[status["target_id"]], status["source_update_date"])
+                    for status in statuses.data or []
+                    if status["source_update_date"]
+                )
+            return update_dates
+        except Exception as e:
+            logger.error("Error getting processed update dates: %s", e)
+            raise
+
+    def get_summary_source_hashes(self, target_ids: List[str], target_type: str) -> Dict[str, str]:
+        """Map target ids to the source text hash of their stored AI summary."""
+        try:
+            if not target_ids:
+                return {}
+            hashes = {}
+            for start in range(0, len(target_ids), IN_FILTER_SIZE):
+                result = (self.client.table("ai_summaries")
+                        .select("target_id,source_text_sha256")
+                        .eq("target_type", target_type)
+                        .in_("target_id", target_ids[start:start + IN_FILTER_SIZE])
+                        .execute())
+                hashes.update(
+                    (summary["target_id"], summary["source_text_sha256"])
+                    for summary in result.data or []
+                    if summary["source_text_sha256"]
+                )
+            return hashes
+        except Exception as e:
+            logger.error("Error getting summary source hashes: %s", e)
+            raise
+
+    def _before_cursor(self, query, updated_before, before_id: Optional[str]):
+        """Restrict a query ordered by (updated_at, id) descending to rows after a keyset cursor."""
+        if updated_before is None:
+            return query
+        if isinstance(updated_before, datetime):
+            updated_before = updated_before.isoformat()
+        if before_id is None:
+            return query.lt("updated_at", updated_before)
+        # Rows written in one bulk upsert share updated_at, so ties are broken by id;
+        # postgrest-py 0.11 has no or_ builder, so the logic tree is added as a raw param
+        query.params = query.params.add(
+            "or", f'(updated_at.lt."{updated_before}",and(updated_at.eq."{updated_before}",id.lt.{before_id}))'
+        )
+        return query
+
+    def get_bills_for_processing(self, limit: int = 100, updated_before: Optional[datetime] = None,
+                                 before_id: Optional[str] = None) -> List[Dict]:
+        """Get bills that need to be processed or updated, most recently updated first.
+
+        Pass the last row's updated_at and id as updated_before and before_id to fetch the next page.
+        """
+        try:
+            query = (self.client.table("bills")
+                    .select(BILL_PROCESSING_COLUMNS)
                     .order("updated_at", desc=True)
-                    .limit(limit)
-                    .execute())
+                    .order("id", desc=True)
+                    .limit(limit))
+            result = self._before_cursor(query, updated_before, before_id).execute()
             return result.data if result.data else []
         except Exception as e:
-            logger.error(f"Error getting bills for processing: {str(e)}")
+            logger.error("Error getting bills for processing: %s", e)
             raise
 
-    def get_amendments_for_processing(self, limit: int = 100) -> List[Dict]:
-        """Get amendments that need to be processed or updated."""
+    def iter_bills_for_processing(self, page_size: int = 500) -> Iterator[Dict]:
+        """Yield bills in the same order as get_bills_for_processing, fetching one page at a time."""
+        return self._iter_for_processing(self.get_bills_for_processing, page_size)
+
+    def get_amendments_for_processing(self, limit: int = 100, updated_before: Optional[datetime] = None,
+                                      before_id: Optional[str] = None) -> List[Dict]:
+        """Get amendments that need to be processed or updated, most recently updated first.
+
+        Pass the last row's updated_at and id as updated_before and before_id to fetch the next page.
+        """
         try:
-            result = (self.client.table("amendments")
-                    .select("*")
+            query = (self.client.table("amendments")
+                    .select(AMENDMENT_PROCESSING_COLUMNS)
                     .order("updated_at", desc=True)
-                    .limit(limit)
-                    .execute())
+                    .order("id", desc=True)
+                    .limit(limit))
+            result = self._before_cursor(query, updated_before, before_id).execute()
             return result.data if result.data else []
         except Exception as e:
-            logger.error(f"Error getting amendments for processing: {str(e)}")
+            logger.error("Error getting amendments for processing: %s", e)
             raise
 
+    def iter_amendments_for_processing(self, page_size: int = 500) -> Iterator[Dict]:
+        """Yield amendments in the same order as get_amendments_for_processing, fetching one page at a time."""
+        return self._iter_for_processing(self.get_amendments_for_processing, page_size)
+
+    def _iter_for_processing(self, fetch: Callable[..., List[Dict]], page_size: int) -> Iterator[Dict]:
+        """Page through a processing listing with a keyset cursor, so deep pages cost the same as the first."""
+        updated_before = before_id = None
+        while True:
+            page = fetch(page_size, updated_before=updated_before, before_id=before_id)
+            yield from page
+            if len(page) < page_size:
+                return
+            updated_before, before_id = page[-1]["updated_at"], page[-1]["id"]
+
     def get_bill_with_summaries(self, congress: int, bill_type: str, bill_number: int) -> Optional[Dict]:
         """Get a bill with its AI summaries and amendments."""
+        return self._cached_read(
+            bill_uuid(congress, bill_type, bill_number),
+            lambda: self._load_bill_with_summaries(congress, bill_type, bill_number)
+        )
+
+    def _load_bill_with_summaries(self, congress: int, bill_type: str, bill_number: int) -> Optional[Dict]:
         try:
-            # First, get the bill
-            result = (self.client.table("bills")
-                    .select("*")
-                    .eq("congress_number", congress)
-                    .eq("bill_type", bill_type)
-                    .eq("bill_number", bill_number)
-                    .single()
-                    .execute())
-            
-            if not result.data:
-                return None
-            
-            bill = result.data
-            
-            # Then, get the AI summaries for the bill
-            summaries = (self.client.table("ai_summaries")
-                      .select("*")
-                      .eq("target_id", bill["id"])
-                      .eq("target_type", "bill")
-                      .execute())
-            
-            # Finally, get the amendments for the bill
-            amendments = (self.client.table("amendments")
-                       .select("*")
-                       .eq("bill_id", bill["id"])
-                       .execute())
-            
-            # Combine the results
-            bill["ai_summaries"] = summaries.data if summaries.data else []
-            bill["amendments"] = amendments.data if amendments.data else []
-            
-            return bill
+            # The get_bill_with_summaries function assembles the bill, its
+            # summaries and its amendments' listing columns in one query
+            result = self.client.rpc("get_bill_with_summaries", {
+                "p_congress": congress,
+                "p_bill_type": bill_type,
+                "p_bill_number": bill_number
+            }).execute()
+            return result.data or None
         except Exception as e:
-            logger.error("Error getting bill with summaries: %s", str(e))
+            logger.error("Error getting bill with summaries: %s", e)
             return None
 
     def get_amendment_with_summaries(self, congress: int, amendment_type: str, amendment_number: int) -> Optional[Dict]:
         """Get an amendment with its AI summaries."""
+        return self._cached_read(
+            amendment_uuid(congress, amendment_type, amendment_number),
+            lambda: self._load_amendment_with_summaries(congress, amendment_type, amendment_number)
+        )
+
+    def _load_amendment_with_summaries(self, congress: int, amendment_type: str, amendment_number: int) -> Optional[Dict]:
         try:
             result = (self.client.table("amendments")
                     .select("*, ai_summaries(*)")
@@ -215,7 +507,7 @@ class DatabaseService:
                     .execute())
             return result.data if result.data else None
         except Exception as e:
-            logger.error(f"Error getting amendment with summaries: {str(e)}")
+            logger.error("Error getting amendment with summaries: %s", e)
             return None
 
     def get_recent_summaries(self, limit: int = 10) -> List[Dict]:
@@ -223,7 +515,7 @@ class DatabaseService:
         try:
             # Get the most recent AI summaries
             result = (self.client.table("ai_summaries")
-                    .select("*")
+                    .select(SUMMARY_COLUMNS)
                     .order("created_at", desc=True)
                     .limit(limit)
                     .execute())
@@ -231,30 +523,29 @@ class DatabaseService:
             if not result.data:
                 return []
             
-            # For each summary, get its associated bill or amendment
-            summaries = []
-            for summary in result.data:
-                if summary["target_type"] == "bill":
-                    target = (self.client.table("bills")
-                           .select("*")
-                           .eq("id", summary["target_id"])
-                           .single()
-                           .execute())
-                    if target.data:
-                        summary["bill"] = target.data
-                else:  # target_type == "amendment"
-                    target = (self.client.table("amendments")
-                           .select("*")
-                           .eq("id", summary["target_id"])
-                           .single()
-                           .execute())
-                    if target.data:
-                        summary["amendment"] = target.data
-                summaries.append(summary)
+            # Fetch every summary's bill or amendment with one query per table
+            summaries = result.data
+            bill_ids = list({summary["target_id"] for summary in summaries if summary["target_type"] == "bill"})
+            amendment_ids = list({summary["target_id"] for summary in summaries if summary["target_type"] == "amendment"})
+            targets = {}
+            if bill_ids:
+                bills = self.client.table("bills").select(BILL_LISTING_COLUMNS).in_("id", bill_ids).execute()
+                targets.update((("bill", bill["id"]), bill) for bill in bills.data or [])
+            if amendment_ids:
+                amendments = (self.client.table("amendments")
+                        .select(AMENDMENT_LISTING_COLUMNS)
+                        .in_("id", amendment_ids)
+                        .execute())
+                targets.update((("amendment", amendment["id"]), amendment) for amendment in amendments.data or [])
+            
+            for summary in summaries:
+                target = targets.get((summary["target_type"], summary["target_id"]))
+                if target:
+                    summary[summary["target_type"]] = target
             
             return summaries
         except Exception as e:
-            logger.error("Error getting recent summaries: %s", str(e))
+            logger.error("Error getting recent summaries: %s", e)
             raise
 
     def get_processing_errors(self) -> List[Dict]:
@@ -265,5 +556,101 @@ class DatabaseService:
                     .eq("status", "error")
                     .execute())
         except Exception as e:
-            logger.error(f"Error getting processing errors: {str(e)}")
-            raise 
\ No newline at end of file
+            logger.error("Error getting processing errors: %s", e)
+            raise
+
+    def get_summarized_target_ids(self, target_ids: List[str], target_type: str) -> set:
+        """Return the subset of target ids that already have an AI summary."""
+        try:
+            if not target_ids:
+                return set()
+            result = (self.client.table("ai_summaries")
+                    .select("target_id")
+                    .eq("target_type", target_type)
+                    .in_("target_id", target_ids)
+                    .execute())
+            return {summary["target_id"] for summary in result.data or []}
+        except Exception as e:
+            logger.error("Error getting summarized targets: %s", e)
+            raise
+
+    def create_batch_job(self, batch_id: str, request_count: int) -> Dict:
+        """Record a submitted OpenAI batch job."""
+        try:
+            result = self.client.table("batch_jobs").insert({
+                "batch_id": batch_id,
+                "status": "validating",
+                "request_count": request_count
+            }).execute()
+            logger.info("Recorded batch job %s", batch_id)
+            return result.data[0]
+        except Exception as e:
+            logger.error("Error recording batch job: %s", e)
+            raise
+
+    def update_batch_job_status(self, batch_id: str, status: str) -> None:
+        """Update the status of a recorded OpenAI batch job."""
+        try:
+            self.client.table("batch_jobs").update({"status": status}, returning=ReturnMethod.minimal).eq("batch_id", batch_id).execute()
+        except Exception as e:
+            logger.error("Error updating batch job %s: %s", batch_id, e)
+            raise
+
+    def get_open_batch_jobs(self) -> List[Dict]:
+        """Get batch jobs that have not reached a final status."""
+        try:
+            result = (self.client.table("batch_jobs")
+                    .select("batch_id,status,request_count")
+                    .in_("status", list(OPEN_BATCH_STATUSES))
+                    .execute())
+            return result.data or []
+        except Exception as e:
+            logger.error("Error getting open batch jobs: %s", e)
+            raise
+
+    def get_cached_completion(self, key: str) -> Optional[str]:
+        """Get a cached OpenAI completion by prompt hash."""
+        try:
+            result = (self.client.table("llm_cache")
+                    .select("response")
+                    .eq("key", key)
+                    .limit(1)
+                    .execute())
+            return result.data[0]["response"] if result.data else None
+        except Exception as e:
+            logger.error("Error getting cached completion: %s", e)
+            raise
+
+    def cache_completion(self, key: str, response: str) -> None:
+        """Cache an OpenAI completion by prompt hash."""
+        try:
+            self.client.table("llm_cache").upsert({"key": key, "response": response}, on_conflict="key",
+                                                returning=ReturnMethod.minimal).execute()
+        except Exception as e:
+            logger.error("Error caching completion: %s", e)
+            raise
+
+    def get_sync_watermark(self, name: str) -> Optional[str]:
+        """Get the timestamp an incremental sync last reached."""
+        try:
+            result = (self.client.table("sync_state")
+                    .select("watermark")
+                    .eq("name", name)
+                    .limit(1)
+                    .execute())
+            return result.data[0]["watermark"] if result.data else None
+        except Exception as e:
+            logger.error("Error getting sync watermark %s: %s", name, e)
+            raise
+
+    def set_sync_watermark(self, name: str, watermark: str) -> None:
+        """Record the timestamp an incremental sync has reached."""
+        try:
+            self.client.table("sync_state").upsert({
+                "name": name,
+                "watermark": watermark,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }, on_conflict="name", returning=ReturnMethod.minimal).execute()
+        except Exception as e:
+            logger.error("Error setting sync watermark %s: %s", name, e)
+            raise
@@ -1,21 +1,46 @@
 import logging
-from typing import Optional, Dict
-from supabase import create_client, Client
-from supabase.lib.client_options import ClientOptions
+from typing import List
+from supabase import Client
 import os
 
+from src.services.database import get_supabase_client
+
 logger = logging.getLogger(__name__)
 
-# Set these environment variables or replace with your actual values.
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+# Tables ensure_tables_exist creates when they are missing
+REQUIRED_TABLES = ("bills", "amendments")
+
+# DDL ensure_tables_exist sends through run_sql, built once at import
+CREATE_TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS public.bills (
+    id BIGSERIAL PRIMARY KEY,
+    congress INT NOT NULL,
+    type VARCHAR(10) NOT NULL,
+    number VARCHAR(50) NOT NULL,
+    title TEXT,
+    update_date DATE
+);
+
+CREATE TABLE IF NOT EXISTS public.amendments (
+    id BIGSERIAL PRIMARY KEY,
+    congress INT NOT NULL,
+    type VARCHAR(10) NOT NULL,
+    number VARCHAR(50) NOT NULL,
+    description TEXT,
+    purpose TEXT,
+    action_date DATE,
+    action_text TEXT
+);
+"""
+
+def get_supabase() -> Client:
+    """Return the process-wide Supabase client, created on first use rather than at import."""
+    return get_supabase_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
 
-# Initialize the Supabase client
-supabase: Client = create_client(
-    SUPABASE_URL,
-    SUPABASE_KEY,
-    options=ClientOptions()
-)
+def missing_tables(names: List[str]) -> List[str]:
+    """Return the given public tables that don't exist, checked in a single pg_tables_exist call."""
+    existing = set(get_supabase().rpc("pg_tables_exist", {"names": list(names)}).execute().data or [])
+    return [name for name in names if name not in existing]
 
 def ensure_tables_exist() -> None:
     """
@@ -37,34 +62,14 @@ def ensure_tables_exist() -> None:
     # This function allows you to execute arbitrary SQL statements from Supabase RPC calls.
     # Then you can call it here to create the tables if they don't exist.
 
-    create_tables_sql = """
-    CREATE TABLE IF NOT EXISTS public.bills (
-        id BIGSERIAL PRIMARY KEY,
-        congress INT NOT NULL,
-        type VARCHAR(10) NOT NULL,
-        number VARCHAR(50) NOT NULL,
-        title TEXT,
-        update_date DATE
-    );
-
-    CREATE TABLE IF NOT EXISTS public.amendments (
-        id BIGSERIAL PRIMARY KEY,
-        congress INT NOT NULL,
-        type VARCHAR(10) NOT NULL,
-        number VARCHAR(50) NOT NULL,
-        description TEXT,
-        purpose TEXT,
-        action_date DATE,
-        action_text TEXT
-    );
-    """
-
     try:
-        # Call your Postgres function to run the SQL script
-        response = supabase.rpc("run_sql", {"query": create_tables_sql}).execute()
-        if "error" in response or response.get("status_code", 200) != 200:
-            logger.error("Failed to create tables: %s", response)
-        else:
-            logger.info("Ensured 'bills' and 'amendments' tables exist.")
+        if not missing_tables(REQUIRED_TABLES):
+            logger.info("Tables %s already exist", ", ".join(REQUIRED_TABLES))
+            return
+
+        # Call your Postgres function to run the SQL script; execute()
+        # raises APIError when it fails
+        get_supabase().rpc("run_sql", {"query": CREATE_TABLES_SQL}).execute()
+        logger.info("Ensured 'bills' and 'amendments' tables exist.")
     except Exception as e:
         logger.error("Error ensuring tables exist: %s", e) 
\ No newline at end of file
@@ -0,0 +1,33 @@
+import logging
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+logger = logging.getLogger(__name__)
+
+# One connection pool per process, shared by every service using the same key
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+REQUEST_TIMEOUT = 30  # seconds
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS)
+
+@lru_cache(maxsize=None)
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """Return the process-wide async OpenAI client for an API key, creating it on first use."""
+    logger.info("Creating shared async OpenAI client")
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(limits=_limits(), timeout=REQUEST_TIMEOUT)
+    )
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for an API key, creating it on first use."""
+    logger.info("Creating shared OpenAI client")
+    return OpenAI(
+        api_key=api_key,
+        http_client=httpx.Client(limits=_limits(), timeout=REQUEST_TIMEOUT)
+    )
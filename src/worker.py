@@ -0,0 +1,25 @@
+import asyncio
+import logging
+
+from src.main import start_services, stop_services
+
+logger = logging.getLogger(__name__)
+
+async def run() -> None:
+    """Run the bill processing scheduler until the process is stopped."""
+    await start_services(run_scheduler=True)
+    logger.info("Bill processing worker started")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stop_services()
+
+def main() -> None:
+    """Run the processing pipeline in its own process, apart from the web workers."""
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+-- Record the Congress.gov updateDate each target was processed at, so
+-- unchanged bills can be skipped on later runs
+ALTER TABLE processing_status
+ADD COLUMN IF NOT EXISTS source_update_date TEXT;
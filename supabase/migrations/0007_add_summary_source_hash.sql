@@ -0,0 +1,4 @@
+-- Hash of the prompt each summary was generated from, so summaries of
+-- unchanged input can be reused instead of regenerated
+ALTER TABLE ai_summaries
+ADD COLUMN IF NOT EXISTS source_text_sha256 CHAR(64);
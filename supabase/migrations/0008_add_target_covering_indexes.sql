@@ -0,0 +1,17 @@
+-- The (target_id, target_type) unique constraints already index these
+-- columns, so the plain composite indexes from 0001 only add write cost
+DROP INDEX IF EXISTS idx_ai_summaries_target;
+DROP INDEX IF EXISTS idx_processing_status_target;
+
+-- Covering index for the stored summary hash lookup, answered by an
+-- index-only scan
+CREATE INDEX IF NOT EXISTS idx_ai_summaries_target_hash
+    ON ai_summaries (target_id, target_type)
+    INCLUDE (source_text_sha256);
+
+-- Partial covering index for the lookup of bills completed at a given
+-- updateDate
+CREATE INDEX IF NOT EXISTS idx_processing_status_completed_bills
+    ON processing_status (target_id)
+    INCLUDE (source_update_date)
+    WHERE target_type = 'bill' AND status = 'completed';
@@ -0,0 +1,84 @@
+-- Derive bill and amendment ids from their natural keys with UUIDv5, so
+-- the same bill always has the same id and clients can compute it.
+-- Namespaces must match BILL_ID_NAMESPACE / AMENDMENT_ID_NAMESPACE in
+-- src/services/database.py.
+CREATE OR REPLACE FUNCTION bill_uuid(congress INTEGER, bill_type TEXT, bill_number INTEGER)
+RETURNS UUID AS $$
+    SELECT uuid_generate_v5('121e6022-a8eb-4dbf-8348-11209eb71f33'::uuid, congress || '-' || bill_type || '-' || bill_number);
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION amendment_uuid(congress INTEGER, amendment_type TEXT, amendment_number INTEGER)
+RETURNS UUID AS $$
+    SELECT uuid_generate_v5('c629c3b3-da0f-4ace-8d34-889d6c087de6'::uuid, congress || '-' || amendment_type || '-' || amendment_number);
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Let id changes on bills carry through to their amendments
+ALTER TABLE amendments DROP CONSTRAINT IF EXISTS amendments_bill_id_fkey;
+ALTER TABLE amendments
+ADD CONSTRAINT amendments_bill_id_fkey FOREIGN KEY (bill_id)
+    REFERENCES bills(id) ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- Re-key existing rows. Summary and status targets move first, with the
+-- target validation triggers off since the new ids don't exist yet.
+ALTER TABLE ai_summaries DISABLE TRIGGER validate_target_id_trigger;
+ALTER TABLE processing_status DISABLE TRIGGER validate_target_id_trigger_processing_status;
+
+UPDATE ai_summaries s
+SET target_id = bill_uuid(b.congress_number, b.bill_type, b.bill_number)
+FROM bills b
+WHERE s.target_type = 'bill' AND s.target_id = b.id;
+
+UPDATE processing_status p
+SET target_id = bill_uuid(b.congress_number, b.bill_type, b.bill_number)
+FROM bills b
+WHERE p.target_type = 'bill' AND p.target_id = b.id;
+
+UPDATE ai_summaries s
+SET target_id = amendment_uuid(a.congress_number, a.amendment_type, a.amendment_number)
+FROM amendments a
+WHERE s.target_type = 'amendment' AND s.target_id = a.id;
+
+UPDATE processing_status p
+SET target_id = amendment_uuid(a.congress_number, a.amendment_type, a.amendment_number)
+FROM amendments a
+WHERE p.target_type = 'amendment' AND p.target_id = a.id;
+
+UPDATE bills
+SET id = bill_uuid(congress_number, bill_type, bill_number)
+WHERE id <> bill_uuid(congress_number, bill_type, bill_number);
+
+UPDATE amendments
+SET id = amendment_uuid(congress_number, amendment_type, amendment_number)
+WHERE id <> amendment_uuid(congress_number, amendment_type, amendment_number);
+
+ALTER TABLE ai_summaries ENABLE TRIGGER validate_target_id_trigger;
+ALTER TABLE processing_status ENABLE TRIGGER validate_target_id_trigger_processing_status;
+
+-- New rows always get the derived id, whichever client inserts them
+CREATE OR REPLACE FUNCTION set_bill_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.id = bill_uuid(NEW.congress_number, NEW.bill_type, NEW.bill_number);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION set_amendment_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.id = amendment_uuid(NEW.congress_number, NEW.amendment_type, NEW.amendment_number);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS set_bill_id_trigger ON bills;
+CREATE TRIGGER set_bill_id_trigger
+    BEFORE INSERT ON bills
+    FOR EACH ROW
+    EXECUTE FUNCTION set_bill_id();
+
+DROP TRIGGER IF EXISTS set_amendment_id_trigger ON amendments;
+CREATE TRIGGER set_amendment_id_trigger
+    BEFORE INSERT ON amendments
+    FOR EACH ROW
+    EXECUTE FUNCTION set_amendment_id();
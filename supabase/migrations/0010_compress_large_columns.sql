@@ -0,0 +1,19 @@
+-- Compress newly written large values with LZ4 (PostgreSQL 14+), which
+-- decompresses several times faster than the default pglz. Existing
+-- values keep their compression until they are rewritten.
+ALTER TABLE bills
+ALTER COLUMN description SET COMPRESSION lz4,
+ALTER COLUMN actions SET COMPRESSION lz4;
+
+ALTER TABLE amendments
+ALTER COLUMN description SET COMPRESSION lz4,
+ALTER COLUMN actions SET COMPRESSION lz4;
+
+ALTER TABLE ai_summaries
+ALTER COLUMN summary SET COMPRESSION lz4,
+ALTER COLUMN perspective SET COMPRESSION lz4,
+ALTER COLUMN key_points SET COMPRESSION lz4,
+ALTER COLUMN estimated_cost_impact SET COMPRESSION lz4,
+ALTER COLUMN government_growth_analysis SET COMPRESSION lz4,
+ALTER COLUMN market_impact_analysis SET COMPRESSION lz4,
+ALTER COLUMN liberty_impact_analysis SET COMPRESSION lz4;
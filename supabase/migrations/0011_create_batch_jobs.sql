@@ -0,0 +1,16 @@
+-- OpenAI Batch API jobs submitted for summary backfills
+CREATE TABLE IF NOT EXISTS batch_jobs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    batch_id VARCHAR(100) NOT NULL UNIQUE,
+    status VARCHAR(20) NOT NULL,
+    request_count INTEGER NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_batch_jobs_status ON batch_jobs(status);
+
+CREATE TRIGGER update_batch_jobs_updated_at
+    BEFORE UPDATE ON batch_jobs
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
@@ -0,0 +1,7 @@
+-- OpenAI completions keyed by a hash of the full request, so identical
+-- prompts are answered without calling the model again
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key CHAR(32) PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
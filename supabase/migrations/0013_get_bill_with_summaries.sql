@@ -0,0 +1,33 @@
+-- Assemble a bill, its AI summaries and its amendments in one round trip.
+-- Amendments carry only their listing columns (AMENDMENT_LISTING_COLUMNS in
+-- src/services/database.py); their full text is served per amendment.
+CREATE OR REPLACE FUNCTION get_bill_with_summaries(p_congress INTEGER, p_bill_type TEXT, p_bill_number INTEGER)
+RETURNS JSONB AS $$
+    SELECT to_jsonb(b)
+        || jsonb_build_object(
+            'ai_summaries', COALESCE((
+                SELECT jsonb_agg(to_jsonb(s) ORDER BY s.created_at DESC)
+                FROM ai_summaries s
+                WHERE s.target_id = b.id AND s.target_type = 'bill'
+            ), '[]'::jsonb),
+            'amendments', COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'id', a.id,
+                    'bill_id', a.bill_id,
+                    'congress_number', a.congress_number,
+                    'amendment_type', a.amendment_type,
+                    'amendment_number', a.amendment_number,
+                    'purpose', a.purpose,
+                    'latest_action_date', a.latest_action_date,
+                    'latest_action_text', a.latest_action_text,
+                    'url', a.url
+                ) ORDER BY a.amendment_number)
+                FROM amendments a
+                WHERE a.bill_id = b.id
+            ), '[]'::jsonb)
+        )
+    FROM bills b
+    WHERE b.congress_number = p_congress
+      AND b.bill_type = p_bill_type
+      AND b.bill_number = p_bill_number;
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,7 @@
+-- High-water marks of incremental Congress.gov polling: each sync resumes
+-- from the latest update it has fully processed
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    watermark TIMESTAMP WITH TIME ZONE NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,12 @@
+-- Indexes for the ORDER BY ... LIMIT listings, so each page is read from the
+-- top of an index rather than sorted out of a full table scan; the processing
+-- listings page by the (updated_at, id) keyset, so id breaks ties
+CREATE INDEX IF NOT EXISTS idx_bills_updated_at_id ON bills (updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_amendments_updated_at_id ON amendments (updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_ai_summaries_created_at ON ai_summaries (created_at DESC);
+
+-- Partial index for the processing errors listing
+CREATE INDEX IF NOT EXISTS idx_processing_status_errors
+    ON processing_status (target_id)
+    WHERE status = 'error';
+
@@ -0,0 +1,20 @@
+-- Raise missing summary and status targets as foreign key violations (SQLSTATE
+-- 23503), so writers can tell them apart from other failures without first
+-- looking the target up
+CREATE OR REPLACE FUNCTION validate_target_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.target_type = 'bill' THEN
+        IF NOT EXISTS (SELECT 1 FROM public.bills WHERE id = NEW.target_id) THEN
+            RAISE EXCEPTION 'Referenced bill % does not exist', NEW.target_id
+                USING ERRCODE = 'foreign_key_violation';
+        END IF;
+    ELSIF NEW.target_type = 'amendment' THEN
+        IF NOT EXISTS (SELECT 1 FROM public.amendments WHERE id = NEW.target_id) THEN
+            RAISE EXCEPTION 'Referenced amendment % does not exist', NEW.target_id
+                USING ERRCODE = 'foreign_key_violation';
+        END IF;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,8 @@
+-- Report which of the given public tables exist, so a schema check costs one
+-- round trip however many tables it covers
+CREATE OR REPLACE FUNCTION pg_tables_exist(names TEXT[])
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(array_agg(table_name::TEXT), '{}')
+    FROM information_schema.tables
+    WHERE table_schema = 'public' AND table_name = ANY(names);
+$$ LANGUAGE sql STABLE;
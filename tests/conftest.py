@@ -0,0 +1,66 @@
+import re
+import asyncio
+from typing import Callable, List
+import httpx
+import orjson
+import pytest
+from src.services.congress_client import CongressClient
+
+class CongressAPIMock:
+    """Answer Congress.gov requests with canned responses matched by URL path pattern."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget registered routes and recorded requests."""
+        self.routes = []
+        self.requests = []
+
+    def add(self, pattern: str, json=None, status: int = 200, headers=None) -> None:
+        """Register a response for requests whose path matches pattern; earlier routes win."""
+        content = orjson.dumps(json) if json is not None else b""
+        self.add_handler(pattern, lambda request: httpx.Response(status, headers=headers, content=content))
+
+    def add_sequence(self, pattern: str, responses: List[httpx.Response]) -> None:
+        """Answer successive requests whose path matches pattern with the given responses in order."""
+        pending = iter(responses)
+        self.add_handler(pattern, lambda request: next(pending))
+
+    def add_handler(self, pattern: str, handler: Callable[[httpx.Request], httpx.Response]) -> None:
+        """Answer requests whose path matches pattern by calling handler."""
+        self.routes.append((re.compile(pattern), handler))
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        for pattern, handler in self.routes:
+            if pattern.search(request.url.path):
+                return handler(request)
+        return httpx.Response(404, content=orjson.dumps({"error": "Unknown resource"}))
+
+@pytest.fixture(scope="module")
+def run():
+    """Run coroutines on one event loop per module, so module-scoped clients stay bound to it."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+@pytest.fixture(scope="module")
+def congress_mock():
+    return CongressAPIMock()
+
+@pytest.fixture(scope="module")
+def congress_client(congress_mock, run):
+    """One client per module; congress_api resets its state between tests."""
+    # A quota high enough that pacing never delays the tests
+    client = CongressClient(api_key="test_key", transport=httpx.MockTransport(congress_mock),
+                            requests_per_hour=3_600_000)
+    yield client
+    run(client.aclose())
+
+@pytest.fixture
+def congress_api(congress_mock, congress_client):
+    congress_mock.reset()
+    congress_client._response_cache.clear()
+    congress_client._response_cache_bytes = 0
+    return congress_mock
@@ -0,0 +1,134 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+from src.services.ai_service import AIService
+
+def completion(content):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = json.dumps(content)
+    return response
+
+def test_concurrent_bill_summaries_share_one_request():
+    async def summarize():
+        service = AIService(api_key="test_key")
+
+        async def create(**kwargs):
+            prompt = kwargs["messages"][1]["content"]
+            if "Bill 1:" in prompt:
+                # The batch answer leaves out the third bill
+                return completion({"results": [{"id": 1, "summary": "one"}, {"id": "2", "summary": "two"}]})
+            return completion({"summary": "single"})
+
+        service.client = MagicMock()
+        service.client.chat.completions.create = AsyncMock(side_effect=create)
+        bills = [{"title": f"Bill {n}"} for n in range(3)]
+        summaries = await asyncio.gather(*(service.generate_bill_summary(bill) for bill in bills))
+        return summaries, service.client.chat.completions.create.await_count
+
+    summaries, calls = asyncio.run(summarize())
+
+    assert [summary["summary"] for summary in summaries] == ["one", "two", "single"]
+    assert calls == 2
+
+def test_batched_bills_are_cached_individually():
+    async def summarize():
+        service = AIService(api_key="test_key")
+
+        async def create(**kwargs):
+            if "Bill 1:" in kwargs["messages"][1]["content"]:
+                return completion({"results": [{"id": 1, "summary": "zero"}, {"id": 2, "summary": "one"}]})
+            return completion({"summary": "single"})
+
+        service.client = MagicMock()
+        service.client.chat.completions.create = AsyncMock(side_effect=create)
+        bills = [{"title": f"Bill {n}"} for n in range(3)]
+        await asyncio.gather(*(service.generate_bill_summary(bill) for bill in bills[:2]))
+        summaries = await asyncio.gather(*(service.generate_bill_summary(bill) for bill in bills))
+        return summaries, service.client.chat.completions.create.await_args_list
+
+    summaries, calls = asyncio.run(summarize())
+
+    assert [summary["summary"] for summary in summaries] == ["zero", "one", "single"]
+    # Only the bill missing from the cache is sent, on its own
+    assert len(calls) == 2
+    assert "Bill 1:" not in calls[1].kwargs["messages"][1]["content"]
+
+def test_identical_prompts_are_answered_from_cache():
+    async def summarize_twice():
+        service = AIService(api_key="test_key")
+        service.client = MagicMock()
+        service.client.chat.completions.create = AsyncMock(return_value=completion({"summary": "cached"}))
+        first = await service.generate_amendment_summary({"type": "SAMDT", "number": "1"})
+        second = await service.generate_amendment_summary({"type": "SAMDT", "number": "1"})
+        return first, second, service.client.chat.completions.create.await_count
+
+    first, second, calls = asyncio.run(summarize_twice())
+
+    assert first == second == {"summary": "cached"}
+    assert calls == 1
+
+def test_stream_bill_summary_yields_fields_as_they_complete():
+    content = json.dumps({"summary": "short", "key_points": ["a", "b"]})
+    chunks = [content[i:i + 5] for i in range(0, len(content), 5)]
+
+    async def stream():
+        for text in chunks:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = text
+            yield chunk
+
+    async def collect():
+        service = AIService(api_key="test_key")
+        service.client = MagicMock()
+        service.client.chat.completions.create = AsyncMock(return_value=stream())
+        fields = [field async for field in service.stream_bill_summary({"title": "Bill"})]
+        cached = await service._generate_summary(
+            service._bill_prompt({"title": "Bill"})
+        )
+        return fields, cached, service.client.chat.completions.create.await_count
+
+    fields, cached, calls = asyncio.run(collect())
+
+    assert fields == [("summary", "short"), ("key_points", ["a", "b"])]
+    assert cached == {"summary": "short", "key_points": ["a", "b"]}
+    assert calls == 1
+
+def test_truncated_stream_is_not_cached():
+    content = json.dumps({"summary": "short", "key_points": ["a", "b"]})
+
+    async def stream():
+        chunk = MagicMock()
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = content[:-10]
+        yield chunk
+
+    async def collect():
+        service = AIService(api_key="test_key")
+        service.client = MagicMock()
+        service.client.chat.completions.create = AsyncMock(side_effect=[stream(), completion({"summary": "retried"})])
+        fields = [field async for field in service.stream_bill_summary({"title": "Bill"})]
+        summary = await service._generate_summary(service._bill_prompt({"title": "Bill"}))
+        return fields, summary
+
+    fields, summary = asyncio.run(collect())
+
+    assert fields == [("summary", "short")]
+    assert summary == {"summary": "retried"}
+
+def test_aclose_resolves_bills_waiting_in_the_batch_window():
+    async def summarize_then_close():
+        service = AIService(api_key="test_key")
+        service.client = MagicMock()
+        service.client.chat.completions.create = AsyncMock(return_value=completion({"summary": "single"}))
+        pending = asyncio.create_task(service.generate_bill_summary({"title": "Bill 0"}))
+        await asyncio.sleep(0.01)
+        await service.aclose()
+        assert pending.done()
+        return await pending, service._bill_batcher
+
+    summary, batcher = asyncio.run(summarize_then_close())
+
+    assert summary == {"summary": "single"}
+    assert batcher is None
@@ -0,0 +1,18 @@
+from src.services import ai_summarizer
+
+class ByteEncoding:
+    def encode(self, text):
+        return list(text.encode("utf-8"))
+
+    def decode(self, tokens):
+        return bytes(tokens).decode("utf-8", errors="ignore")
+
+def test_truncate_counts_multibyte_characters(monkeypatch):
+    monkeypatch.setattr(ai_summarizer, "_get_encoding", lambda model: ByteEncoding())
+
+    text = "漢字" * 50
+
+    truncated = ai_summarizer.truncate_to_token_limit(text, max_tokens=100)
+
+    assert len(truncated.encode("utf-8")) <= 100
+    assert text.startswith(truncated)
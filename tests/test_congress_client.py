@@ -1,31 +1,112 @@
+from datetime import datetime, timezone
+import httpx
+import orjson
 import pytest
-from unittest.mock import patch
-from src.services.congress_client import CongressClient
-
-@patch('src.services.congress_client.requests.get')
-def test_get_bill_amendments_success(mock_get):
-    mock_response = {
-        "amendments": [
-            {"type": "HAMDT", "number": "173"},
-            {"type": "SAMDT", "number": "174"}
-        ]
-    }
-    mock_get.return_value.status_code = 200
-    mock_get.return_value.json.return_value = mock_response
-
-    client = CongressClient(api_key="test_key")
-    amendments = client.get_bill_amendments(118, "HR", "9775")
-
-    assert len(amendments) == 2
-    assert amendments[0]["type"] == "HAMDT"
-    assert amendments[1]["number"] == "174"
-
-@patch('src.services.congress_client.requests.get')
-def test_get_bill_amendments_not_found(mock_get):
-    mock_get.return_value.status_code = 404
-    mock_get.return_value.json.return_value = {"error": "Unknown resource"}
-
-    client = CongressClient(api_key="test_key")
-    amendments = client.get_bill_amendments(118, "HR", "9775")
-
-    assert amendments == [] 
\ No newline at end of file
+
+def page(**body):
+    return httpx.Response(200, content=orjson.dumps(body))
+
+@pytest.mark.parametrize("status,payload,expected", [
+    (200, {"amendments": [{"type": "HAMDT", "number": "173"}, {"type": "SAMDT", "number": "174"}]},
+     [("HAMDT", "173"), ("SAMDT", "174")]),
+    (404, {"error": "Unknown resource"}, []),
+])
+def test_get_bill_amendments(congress_api, congress_client, run, status, payload, expected):
+    congress_api.add(r"/bill/118/hr/9775/amendments$", json=payload, status=status)
+    congress_api.add(r"/amendment/118/(\w+)/(\d+)$", json={})
+
+    amendments = run(congress_client.get_bill_amendments(118, "HR", "9775"))
+
+    assert [(amendment["type"], amendment["number"]) for amendment in amendments] == expected
+    assert len(congress_api.requests) == 1 + len(expected)
+
+def test_get_bill_amendments_follows_pagination(congress_api, congress_client, run, monkeypatch):
+    monkeypatch.setattr("src.services.congress_client.AMENDMENT_PAGE_LIMIT", 1)
+    congress_api.add_sequence(r"/bill/118/hr/1/amendments$", [
+        page(amendments=[{"type": "HAMDT", "number": "1"}], pagination={"next": "https://api.congress.gov/v3/..."}),
+        page(amendments=[{"type": "HAMDT", "number": "2"}], pagination={}),
+    ])
+    congress_api.add(r"/amendment/118/(\w+)/(\d+)$", json={})
+
+    amendments = run(congress_client.get_bill_amendments(118, "HR", "1"))
+
+    assert [amendment["number"] for amendment in amendments] == ["1", "2"]
+    assert congress_api.requests[1].url.params["offset"] == "1"
+
+def test_iter_recent_bills_pages_until_short_page(congress_api, congress_client, run):
+    congress_api.add_sequence(r"/bill/118$", [
+        page(bills=[{"number": "1"}, {"number": "2"}]),
+        page(bills=[{"number": "3"}]),
+    ])
+
+    async def collect():
+        return [bill async for bill in congress_client.iter_recent_bills(118, limit=10, page_size=2)]
+
+    bills = run(collect())
+
+    assert [bill["number"] for bill in bills] == ["1", "2", "3"]
+    assert len(congress_api.requests) == 2
+    assert congress_api.requests[1].url.params["offset"] == "2"
+
+def test_make_request_retries_after_rate_limit(congress_api, congress_client, run, monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("src.services.congress_client.asyncio.sleep", fake_sleep)
+    congress_api.add_sequence(r"/bill/118/hr/1$", [
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        page(bill={"number": "1"}),
+    ])
+
+    data = run(congress_client.get_bill_details(118, "hr", "1"))
+
+    assert data == {"bill": {"number": "1"}}
+    assert delays == [2.0]
+
+def test_make_request_revalidates_with_etag(congress_api, congress_client, run):
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, content=orjson.dumps({"bill": {"number": "1"}}))
+
+    congress_api.add_handler(r"/bill/118/hr/1$", handler)
+
+    first = run(congress_client.get_bill_details(118, "hr", "1"))
+    second = run(congress_client.get_bill_details(118, "hr", "1"))
+
+    assert first == second == {"bill": {"number": "1"}}
+    requests = congress_api.requests
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+def test_listing_responses_are_not_cached(congress_api, congress_client, run):
+    congress_api.add(r"/bill/118$", json={"bills": [], "pagination": {}}, headers={"ETag": '"v1"'})
+
+    async def collect():
+        since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        return [bill async for bill in congress_client.iter_updates_since(since, congress=118)]
+
+    run(collect())
+
+    assert not congress_client._response_cache
+    assert congress_client._response_cache_bytes == 0
+
+def test_iter_updates_since_follows_pagination(congress_api, congress_client, run):
+    congress_api.add_sequence(r"/bill/118$", [
+        page(bills=[{"number": "1"}], pagination={"next": "https://api.congress.gov/v3/bill/118?offset=1"}),
+        page(bills=[{"number": "2"}], pagination={}),
+    ])
+
+    async def collect():
+        since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        return [bill async for bill in congress_client.iter_updates_since(since, congress=118, page_size=1)]
+
+    bills = run(collect())
+
+    assert [bill["number"] for bill in bills] == ["1", "2"]
+    requests = congress_api.requests
+    assert requests[0].url.params["fromDateTime"] == "2024-01-01T00:00:00Z"
+    assert requests[0].url.params["sort"] == "updateDate asc"
+    assert requests[1].url.params["offset"] == "1"
@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import MagicMock
+import pytest
+import src.main as main
+
+SUMMARY = {field: "x" for field in (
+    "summary", "perspective", "key_points", "estimated_cost_impact",
+    "government_growth_analysis", "market_impact_analysis", "liberty_impact_analysis",
+)}
+
+class FakeCongressClient:
+    def __init__(self, bills):
+        self.bills = bills
+
+    async def iter_updates_since(self, since_date, congress=None):
+        for bill in self.bills:
+            yield bill
+
+    async def get_bill_details(self, congress, bill_type, bill_number):
+        return {"bill": {"title": f"Bill {bill_number}"}}
+
+    async def get_bill_amendments(self, congress, bill_type, bill_number, bill_data=None):
+        return []
+
+class FakeAIService:
+    def bill_source_hash(self, bill_details):
+        return bill_details["title"]
+
+    async def generate_bill_summary(self, bill_details):
+        if bill_details["title"] == "Bill 1":
+            raise RuntimeError("model unavailable")
+        return SUMMARY
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    bills = [
+        {"congress": 118, "type": "HR", "number": "1", "updateDateIncludingText": "2024-01-02T00:00:00Z"},
+        {"congress": 118, "type": "HR", "number": "2", "updateDateIncludingText": "2024-01-03T00:00:00Z"},
+    ]
+    db = MagicMock()
+    db.get_sync_watermark.return_value = "2024-01-01T00:00:00+00:00"
+    db.get_processed_update_dates.return_value = {}
+    db.get_summary_source_hashes.return_value = {}
+    monkeypatch.setattr(main, "db_service", db)
+    monkeypatch.setattr(main, "congress_client", FakeCongressClient(bills))
+    monkeypatch.setattr(main, "ai_service", FakeAIService())
+    monkeypatch.setattr(main, "schedule_retry", MagicMock())
+    return db
+
+def test_failed_summary_holds_the_watermark(pipeline):
+    asyncio.run(main.process_bills())
+
+    pipeline.set_sync_watermark.assert_called_once_with(main.BILL_SYNC_NAME, "2024-01-02T00:00:00+00:00")
+
+def test_failed_flush_keeps_the_previous_watermark(pipeline):
+    pipeline.bulk_update_processing_status.side_effect = RuntimeError("connection reset")
+
+    asyncio.run(main.process_bills())
+
+    pipeline.set_sync_watermark.assert_not_called()
+    main.schedule_retry.assert_called_once()
@@ -0,0 +1,34 @@
+import asyncio
+import time
+from src.services.rate_limiter import AsyncTokenBucket
+
+def test_token_bucket_allows_burst_then_waits():
+    async def acquire_three():
+        bucket = AsyncTokenBucket(rate=2, period=0.2)
+        start = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+        burst = time.monotonic() - start
+        async with bucket:
+            pass
+        return burst, time.monotonic() - start
+
+    burst, total = asyncio.run(acquire_three())
+
+    assert burst < 0.05
+    assert total >= 0.09
+
+def test_token_bucket_paces_beyond_capacity():
+    async def acquire_three():
+        bucket = AsyncTokenBucket(rate=20, period=1, capacity=1)
+        start = time.monotonic()
+        await bucket.acquire()
+        first = time.monotonic() - start
+        await bucket.acquire()
+        await bucket.acquire()
+        return first, time.monotonic() - start
+
+    first, total = asyncio.run(acquire_three())
+
+    assert first < 0.02
+    assert total >= 0.09
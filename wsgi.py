@@ -1,15 +1,14 @@
 import os
 import logging
-from dotenv import load_dotenv
+
+from src.config import load_env
+from src.logging_config import APP_LOG_FILE, setup_logging
 
 # Load environment variables
-load_dotenv()
+load_env()
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Set up logging; src.main's own setup_logging call is then a no-op
+setup_logging(log_file=APP_LOG_FILE)
 logger = logging.getLogger(__name__)
 
 # Import the FastAPI application
@@ -17,15 +16,20 @@ try:
     from src.main import app
     logger.info("Successfully loaded application")
 except Exception as e:
-    logger.error(f"Failed to load application: {str(e)}")
+    logger.error("Failed to load application: %s", e)
     raise
 
-# This is used by gunicorn to serve the app
+# Run a single local server; deployments start uvicorn directly (see Procfile)
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
         "src.main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", 8000)),
-        log_level="debug"
+        loop="uvloop",
+        http="httptools",
+        log_level=os.getenv("LOG_LEVEL", "info"),
+        access_log=False,
+        limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", 200)),
+        backlog=2048
     ) 
\ No newline at end of file